@@ -0,0 +1,63 @@
+"""
+Mide cuántos eventos inválidos por segundo rechaza GestionEventos.post_events, comparado con
+cuántos eventos válidos se validan por segundo con ValidadorEvento. El rechazo por espacio ocupado se mide
+contra una tabla con muchos eventos, que es donde recorrerla en cada validación se nota.
+
+Uso: python benchmarks/bench_rechazos.py [repeticiones] [eventos en la tabla]
+"""
+import json
+import os
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelo import GestionEventos  # noqa: E402
+
+
+def medir(nombre: str, funcion, repeticiones: int) -> None:
+    segundos = min(timeit.repeat(funcion, number=repeticiones, repeat=5))
+    print(f"{nombre:<40} {repeticiones / segundos:>12,.0f} por segundo")
+
+
+def crear_gestion(directorio: str, nombre: str, eventos: list[dict]) -> GestionEventos:
+    ruta = os.path.join(directorio, f"{nombre}.json")
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump({"eventos": eventos, "ubicaciones": [
+            {"nombre_ubicacion": "Ubicacion", "direccion_ubicacion": "Direccion"}]}, archivo)
+    return GestionEventos(ruta, os.path.join(directorio, f"{nombre}_archivo.jsonl.gz"))
+
+
+def main() -> None:
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    cantidad_eventos = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    with tempfile.TemporaryDirectory() as directorio:
+        gestion = crear_gestion(directorio, "vacia", [])
+
+        manana = (datetime.now() + timedelta(days=1)).replace(hour=10,
+                                                              minute=0, second=0, microsecond=0)
+        manana_str = manana.strftime("%Y-%m-%d %H:%M:%S")
+        # Todos en la misma ubicación: solo importa el tamaño de la tabla, no que los espacios sean válidos
+        poblada = crear_gestion(directorio, "poblada", [
+            {"index": index, "titulo_evento": "Evento", "fecha_hora_evento": manana_str if index == 1 else
+             (manana + timedelta(minutes=index)).strftime("%Y-%m-%d %H:%M:%S"),
+             "descripcion_evento": "Descripcion", "ubicacion_evento": 0}
+            for index in range(1, cantidad_eventos + 1)])
+        pasado = manana - timedelta(days=2)
+
+        medir("post_events, fecha pasada", lambda: gestion.post_events(
+            "Evento", pasado, "Descripcion", 0), repeticiones)
+        medir("post_events, hora no permitida", lambda: gestion.post_events(
+            "Evento", manana.replace(hour=11), "Descripcion", 0), repeticiones)
+        medir("post_events, ubicación inexistente", lambda: gestion.post_events(
+            "Evento", manana, "Descripcion", 5), repeticiones)
+        medir(f"post_events, espacio ocupado ({cantidad_eventos:,})", lambda: poblada.post_events(
+            "Evento", manana, "Descripcion", 0), repeticiones)
+        medir("ValidadorEvento.validar, evento válido", lambda: gestion.validador.validar(
+            "Evento", manana, "Descripcion", 0, 1), repeticiones)
+
+
+if __name__ == "__main__":
+    main()
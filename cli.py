@@ -0,0 +1,262 @@
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from modelo import GestionEventos, ValidadorEvento
+
+CAMPOS = {
+    "eventos": ["index", "titulo_evento", "fecha_hora_evento", "descripcion_evento", "ubicacion_evento"],
+    "ubicaciones": ["nombre_ubicacion", "direccion_ubicacion"]
+}
+TIPOS_EVENTO = {"titulo_evento": str, "fecha_hora_evento": str,
+                "descripcion_evento": str, "ubicacion_evento": int}
+TAMANO_LOTE = 5000
+LOTES_POR_PROCESO = 2
+VALIDADOR = ValidadorEvento()
+
+
+def exportar(gestion: GestionEventos, tabla: str, formato: str, salida) -> int:
+    """
+    Escribir una tabla en NDJSON o CSV, registro por registro, sin armar el documento completo en memoria.
+
+    Args:
+        gestion (GestionEventos): Gestor de la base de datos a exportar.
+        tabla (str): "eventos" o "ubicaciones".
+        formato (str): "ndjson" o "csv".
+        salida (TextIO): Archivo abierto donde se escribe.
+
+    Returns:
+        int: Cantidad de registros exportados.
+
+    Example:
+    >>> exportar(GestionEventos(), "eventos", "ndjson", sys.stdout)
+    """
+    respuesta = gestion.gestor_json.buscar(tabla)
+    if respuesta["codigo"] == 500:
+        raise ValueError(respuesta["mensaje"])
+
+    if formato == "csv":
+        escritor = csv.DictWriter(
+            salida, fieldnames=CAMPOS[tabla], extrasaction="ignore")
+        escritor.writeheader()
+        for registro in respuesta["registro"]:
+            escritor.writerow(registro)
+    else:
+        for registro in respuesta["registro"]:
+            salida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    return len(respuesta["registro"])
+
+
+def leer_lotes(entrada, formato: str):
+    """
+    Leer el archivo de entrada en lotes de TAMANO_LOTE elementos.
+    En NDJSON cada elemento es la línea sin parsear, para que el parseo se haga en los procesos hijos.
+
+    Args:
+        entrada (TextIO): Archivo abierto a importar.
+        formato (str): "ndjson" o "csv".
+
+    Yields:
+        tuple[int, list]: Número de línea del primer elemento y lista de elementos del lote.
+    """
+    if formato == "csv":
+        filas = csv.DictReader(entrada)
+        primera_linea = 2
+    else:
+        filas = entrada
+        primera_linea = 1
+    while True:
+        lote = list(islice(filas, TAMANO_LOTE))
+        if not lote:
+            return
+        yield primera_linea, lote
+        primera_linea += len(lote)
+
+
+def leer_campos(datos: dict, formato: str) -> tuple[dict, str]:
+    """
+    Comprobar los tipos de los campos de un evento como lo hace POST /events, sin convertir valores.
+    En CSV todo llega como texto, así que solo ubicacion_evento se convierte, y solo si es un entero.
+
+    Args:
+        datos (dict): Campos leídos de la línea o fila.
+        formato (str): "ndjson" o "csv".
+
+    Returns:
+        tuple[dict, str]: Los campos y None, o None y el mensaje de error.
+    """
+    faltantes = [campo for campo in TIPOS_EVENTO if datos.get(campo) is None]
+    if faltantes:
+        return None, f"Faltan campos: {faltantes}"
+    campos = {campo: datos[campo] for campo in TIPOS_EVENTO}
+    if formato == "csv":
+        if re.fullmatch(r"-?\d+", campos["ubicacion_evento"]) is None:
+            return None, "El campo 'ubicacion_evento' debe ser de tipo int"
+        campos["ubicacion_evento"] = int(campos["ubicacion_evento"])
+    for campo, tipo in TIPOS_EVENTO.items():
+        # bool es subclase de int, pero true/false no es una ubicación
+        if not isinstance(campos[campo], tipo) or isinstance(campos[campo], bool):
+            return None, f"El campo '{campo}' debe ser de tipo {tipo.__name__}"
+    return campos, None
+
+
+def validar_lote(lote: tuple[int, list], formato: str, cantidad_ubicaciones: int,
+                 fecha_actual: datetime) -> tuple[list, list]:
+    """
+    Parsear y validar un lote de eventos con ValidadorEvento. Se ejecuta en un proceso hijo.
+
+    Args:
+        lote (tuple[int, list]): Número de línea inicial y elementos, como los genera leer_lotes.
+        formato (str): "ndjson" o "csv".
+        cantidad_ubicaciones (int): Número de ubicaciones registradas.
+        fecha_actual (datetime): Fecha de referencia común a todos los procesos.
+
+    Returns:
+        tuple[list, list]: Eventos válidos como (linea, evento) y errores como (linea, mensaje).
+    """
+    primera_linea, elementos = lote
+    validos = []
+    errores = []
+    for linea, elemento in enumerate(elementos, primera_linea):
+        try:
+            if formato == "csv":
+                datos = elemento
+            else:
+                if elemento.strip() == "":
+                    continue
+                datos = json.loads(elemento)
+                if not isinstance(datos, dict):
+                    errores.append((linea, "La línea debe ser un objeto JSON"))
+                    continue
+            campos, error = leer_campos(datos, formato)
+            if error is not None:
+                errores.append((linea, error))
+                continue
+            titulo_evento = campos["titulo_evento"].replace("\n", "")
+            fecha_hora_evento = datetime.strptime(
+                campos["fecha_hora_evento"], "%Y-%m-%d %H:%M:%S")
+            descripcion_evento = campos["descripcion_evento"]
+            ubicacion_evento = campos["ubicacion_evento"]
+            error = VALIDADOR.validar(titulo_evento, fecha_hora_evento, descripcion_evento,
+                                      ubicacion_evento, cantidad_ubicaciones, fecha_actual)
+            if error is not None:
+                errores.append((linea, error["mensaje"]))
+                continue
+            validos.append((linea, {"titulo_evento": titulo_evento,
+                                    "fecha_hora_evento": fecha_hora_evento.strftime("%Y-%m-%d %H:%M:%S"),
+                                    "descripcion_evento": descripcion_evento,
+                                    "ubicacion_evento": ubicacion_evento}))
+        except Exception as e:
+            errores.append((linea, str(e)))
+    return validos, errores
+
+
+def importar(gestion: GestionEventos, entrada, formato: str, procesos: int = None) -> dict:
+    """
+    Importar eventos desde NDJSON o CSV con las mismas reglas de GestionEventos.post_events.
+    El parseo y la validación se reparten en un pool de procesos; la disponibilidad de la ubicación
+    y la escritura se hacen en un solo paso con GestionEventos.post_events_lote.
+    El archivo se lee a medida que se validan los lotes: nunca hay más de LOTES_POR_PROCESO lotes por
+    proceso pendientes, así que solo los eventos válidos se acumulan en memoria hasta la escritura.
+
+    Args:
+        gestion (GestionEventos): Gestor de la base de datos destino.
+        entrada (TextIO): Archivo abierto a importar.
+        formato (str): "ndjson" o "csv".
+        procesos (int): Número de procesos del pool. Si es None se usa el número de CPUs.
+
+    Returns:
+        dict: Respuesta de post_events_lote, con "rechazados" expresados como (linea, mensaje).
+
+    Example:
+    >>> with open("eventos.ndjson", encoding="utf-8") as entrada:
+    >>>     importar(GestionEventos(), entrada, "ndjson")
+    """
+    ubicaciones = gestion.gestor_ubicacion.get_ubicaciones()
+    if ubicaciones["codigo"] == 500:
+        raise ValueError(ubicaciones["mensaje"])
+
+    procesos = procesos or os.cpu_count() or 1
+    cantidad_ubicaciones = len(ubicaciones["registro"])
+    fecha_actual = datetime.now()
+    validos = []
+    rechazados = []
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        pendientes = deque()
+        for lote in leer_lotes(entrada, formato):
+            if len(pendientes) >= procesos * LOTES_POR_PROCESO:
+                validos_lote, errores_lote = pendientes.popleft().result()
+                validos.extend(validos_lote)
+                rechazados.extend(errores_lote)
+            pendientes.append(pool.submit(validar_lote, lote, formato,
+                                          cantidad_ubicaciones, fecha_actual))
+        while pendientes:
+            validos_lote, errores_lote = pendientes.popleft().result()
+            validos.extend(validos_lote)
+            rechazados.extend(errores_lote)
+
+    respuesta = gestion.post_events_lote(
+        [evento for _, evento in validos])
+    if respuesta["codigo"] == 500:
+        return respuesta
+    rechazados.extend((validos[rechazado["posicion"]][0], rechazado["mensaje"])
+                      for rechazado in respuesta["rechazados"])
+    respuesta["rechazados"] = sorted(rechazados)
+    return respuesta
+
+
+def main(argumentos: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Importar y exportar la base de datos de eventos.")
+    parser.add_argument("--base-datos", default="data_base.json",
+                        help="Ruta de la base de datos. Por defecto data_base.json.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    parser_exportar = subparsers.add_parser(
+        "exportar", help="Exportar una tabla a NDJSON o CSV.")
+    parser_exportar.add_argument("tabla", choices=list(CAMPOS.keys()))
+    parser_exportar.add_argument(
+        "--formato", choices=["ndjson", "csv"], default="ndjson")
+    parser_exportar.add_argument(
+        "--salida", help="Archivo de salida. Por defecto la salida estándar.")
+
+    parser_importar = subparsers.add_parser(
+        "importar", help="Importar eventos desde NDJSON o CSV.")
+    parser_importar.add_argument("archivo")
+    parser_importar.add_argument(
+        "--formato", choices=["ndjson", "csv"], default="ndjson")
+    parser_importar.add_argument(
+        "--procesos", type=int, help="Procesos para validar. Por defecto el número de CPUs.")
+
+    args = parser.parse_args(argumentos)
+    gestion = GestionEventos(args.base_datos)
+
+    if args.comando == "exportar":
+        if args.salida:
+            with open(args.salida, "w", encoding="utf-8", newline="") as salida:
+                cantidad = exportar(gestion, args.tabla, args.formato, salida)
+        else:
+            cantidad = exportar(gestion, args.tabla, args.formato, sys.stdout)
+        print(f"{cantidad} registros exportados", file=sys.stderr)
+        return 0
+
+    with open(args.archivo, "r", encoding="utf-8", newline="") as entrada:
+        respuesta = importar(gestion, entrada, args.formato, args.procesos)
+    if respuesta["codigo"] == 500:
+        print(f"Error: {respuesta['mensaje']}", file=sys.stderr)
+        return 1
+    for linea, mensaje in respuesta["rechazados"]:
+        print(f"Línea {linea}: {mensaje}", file=sys.stderr)
+    print(f"{respuesta['creados']} eventos importados, {len(respuesta['rechazados'])} rechazados",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
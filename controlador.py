@@ -1,12 +1,91 @@
-from flask import Flask, request, jsonify
+from flask import Blueprint, Flask, Response, current_app, request, jsonify
 from datetime import datetime
-from modelo import gestor_eventos
+from modelo import GestionEventos, ProveedorGestorEventos
 import flask_cors
 
-app = Flask(__name__)
-flask_cors.CORS(app)
+eventos_bp = Blueprint("eventos", __name__)
 
-@app.route("/events", methods=["POST"])
+
+def crear_app(config: dict = None) -> Flask:
+    """
+    Crea la aplicación Flask. La base de datos no se lee aquí sino en la primera petición de cada proceso,
+    salvo que PRECARGAR sea True.
+
+    Args:
+        config (dict): Valores que reemplazan la configuración por defecto:
+            ARCHIVO_BASE_DATOS (str): Ruta de la base de datos. Por defecto "data_base.json".
+            ARCHIVO_HISTORICO (str): Ruta del almacén frío. Por defecto "data_base_archivo.jsonl.gz".
+            BACKEND (str): Gestor de base de datos. Por defecto "json".
+            PRECARGAR (bool): Leer la base de datos al crear la aplicación, en el proceso que la crea. Con
+                servidores que crean la aplicación antes del fork (gunicorn --preload) se deja en False y se usa
+                calentar_worker. Por defecto False.
+            ARCHIVAR (bool): Iniciar en cada proceso un ArchivadorEventos que mueve los eventos pasados al
+                almacén frío. Por defecto False.
+            ARCHIVO_HORIZONTE_DIAS (int): Días que se conserva un evento pasado antes de archivarlo. Por defecto 30.
+            ARCHIVO_INTERVALO_SEGUNDOS (int): Segundos entre ciclos de archivado. Por defecto 3600.
+            ARCHIVO_CICLOS_COMPACTACION (int): Cada cuántos ciclos se compacta el almacén frío. Por defecto 24.
+
+    Returns:
+        Flask: Aplicación con las rutas registradas.
+
+    Example:
+    >>> app = crear_app({"ARCHIVO_BASE_DATOS": "otra_base.json"})
+    """
+    app = Flask(__name__)
+    app.config.update(ARCHIVO_BASE_DATOS="data_base.json", ARCHIVO_HISTORICO="data_base_archivo.jsonl.gz",
+                      BACKEND="json", PRECARGAR=False, ARCHIVAR=False, ARCHIVO_HORIZONTE_DIAS=30,
+                      ARCHIVO_INTERVALO_SEGUNDOS=3600, ARCHIVO_CICLOS_COMPACTACION=24)
+    if config:
+        app.config.update(config)
+    flask_cors.CORS(app)
+
+    opciones_archivador = None
+    if app.config["ARCHIVAR"]:
+        opciones_archivador = {"horizonte_dias": app.config["ARCHIVO_HORIZONTE_DIAS"],
+                               "intervalo_segundos": app.config["ARCHIVO_INTERVALO_SEGUNDOS"],
+                               "ciclos_compactacion": app.config["ARCHIVO_CICLOS_COMPACTACION"]}
+    proveedor = ProveedorGestorEventos(app.config["ARCHIVO_BASE_DATOS"], app.config["ARCHIVO_HISTORICO"],
+                                       app.config["BACKEND"], opciones_archivador)
+    app.extensions["gestor_eventos"] = proveedor
+    if app.config["PRECARGAR"]:
+        proveedor.calentar()
+
+    app.register_blueprint(eventos_bp)
+    return app
+
+
+def calentar_worker(server, worker) -> None:
+    """
+    Hook post_fork de gunicorn: lee la base de datos en cada worker apenas se bifurca.
+    Sirve con --preload, donde la aplicación se crea en el maestro y PRECARGAR cargaría allí una copia que
+    ningún worker usa. El proveedor detecta el fork y el worker crea su propio gestor.
+
+    Args:
+        server (Arbiter): Proceso maestro de gunicorn.
+        worker (Worker): Worker recién bifurcado.
+
+    Example:
+    >>> # gunicorn.conf.py
+    >>> from controlador import calentar_worker as post_fork
+    """
+    worker.app.wsgi().extensions["gestor_eventos"].calentar()
+
+
+def obtener_gestor_eventos() -> GestionEventos:
+    """
+    Obtiene el gestor de eventos de la aplicación y proceso actuales.
+    """
+    return current_app.extensions["gestor_eventos"].obtener()
+
+
+def respuesta_data_serializada(fragmentos: list[bytes]) -> Response:
+    """
+    Arma la respuesta {"data": [...]} concatenando eventos ya codificados en JSON, sin volver a serializarlos.
+    """
+    return Response(b'{"data":[' + b",".join(fragmentos) + b"]}\n", status=200, mimetype="application/json")
+
+
+@eventos_bp.route("/events", methods=["POST"])
 def post_events():
     """
     Crea un nuevo evento basado en los datos proporcionados en la solicitud JSON.
@@ -27,7 +106,7 @@ def post_events():
     >>>     ó
     >>>     {"error": "El campo '{campo}' debe ser de tipo {tipo}"}
     >>> 500 Internal Server Error:
-    >>>     {"error": "Mensaje de error"}
+    >>>     {"error": "Mensaje de error", "codigo_error": "FECHA_PASADA" | null}
     """
 
     try:
@@ -42,16 +121,16 @@ def post_events():
                 return jsonify({"error": f"El campo '{campo}' debe ser de tipo {tipo.__name__}"}), 400
         data["fecha_hora_evento"] = datetime.strptime(
             data["fecha_hora_evento"], "%Y-%m-%d %H:%M:%S")
-        respuesta = gestor_eventos.post_events(data["titulo_evento"], data["fecha_hora_evento"],
-                                               data["descripcion_evento"], data["ubicacion_evento"])
+        respuesta = obtener_gestor_eventos().post_events(data["titulo_evento"], data["fecha_hora_evento"],
+                                                         data["descripcion_evento"], data["ubicacion_evento"])
         if respuesta["codigo"] == 500:
-            return jsonify({"error": respuesta["mensaje"]}), 500
+            return jsonify({"error": respuesta["mensaje"], "codigo_error": respuesta.get("codigo_error")}), 500
         return jsonify({"mensaje": "Evento creado"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/events", methods=["GET"])
+@eventos_bp.route("/events", methods=["GET"])
 def get_events():
     """
     Obtiene todos los eventos registrados en la base de datos.
@@ -59,6 +138,8 @@ def get_events():
     Returns:
         Response: Un objeto JSON con los eventos registrados en la base de datos y el código de estado HTTP correspondiente.
 
+    Query Params:
+        include_archived (str): "true" para incluir también los eventos archivados. Por defecto "false".
     JSON Request Body:
         None.
     JSON Response:
@@ -75,15 +156,17 @@ def get_events():
     >>>     {"error": "Mensaje de error"}
     """
     try:
-        respuesta = gestor_eventos.get_events()
+        incluir_archivados = request.args.get(
+            "include_archived", "false").lower() == "true"
+        respuesta = obtener_gestor_eventos().get_events_serializados(incluir_archivados)
         if respuesta["codigo"] == 500:
             return jsonify({"error": respuesta["mensaje"]}), 500
-        return jsonify({"data": respuesta["registro"]}), 200
+        return respuesta_data_serializada(respuesta["registro"])
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/events/<int:id_evento>", methods=["GET"])
+@eventos_bp.route("/events/<int:id_evento>", methods=["GET"])
 def get_event_by_id(id_evento):
     """
     Obtiene un evento específico basado en su ID.
@@ -105,15 +188,15 @@ def get_event_by_id(id_evento):
     >>>     {"error": "Mensaje de error"}   
     """
     try:
-        respuesta = gestor_eventos.get_event_by_id(id_evento)
+        respuesta = obtener_gestor_eventos().get_event_by_id_serializado(id_evento)
         if respuesta["codigo"] == 500:
             return jsonify({"error": respuesta["mensaje"]}), 500
-        return jsonify({"data": respuesta["registro"]}), 200
+        return respuesta_data_serializada(respuesta["registro"])
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/events/<int:id_evento>", methods=["PUT"])
+@eventos_bp.route("/events/<int:id_evento>", methods=["PUT"])
 def put_event_by_id(id_evento):
     """
     Actualiza un evento específico basado en su ID y los datos proporcionados en la solicitud JSON.
@@ -134,7 +217,7 @@ def put_event_by_id(id_evento):
     >>>     ó
     >>>     {"error": "El campo '{campo}' debe ser de tipo {tipo}"}
     >>> 500 Internal Server Error:
-    >>>     {"error": "Mensaje de error"}
+    >>>     {"error": "Mensaje de error", "codigo_error": "FECHA_PASADA" | null}
     """
     try:
         data = request.json
@@ -148,16 +231,17 @@ def put_event_by_id(id_evento):
                 return jsonify({"error": f"El campo '{campo}' debe ser de tipo {tipo.__name__}"}), 400
         data["fecha_hora_evento"] = datetime.strptime(
             data["fecha_hora_evento"], "%Y-%m-%d %H:%M:%S")
-        respuesta = gestor_eventos.put_event_by_id(data["titulo_evento"], data["fecha_hora_evento"],
-                                                   data["descripcion_evento"], data["ubicacion_evento"], id_evento)
+        respuesta = obtener_gestor_eventos().put_event_by_id(data["titulo_evento"], data["fecha_hora_evento"],
+                                                             data["descripcion_evento"], data["ubicacion_evento"],
+                                                             id_evento)
         if respuesta["codigo"] == 500:
-            return jsonify({"error": respuesta["mensaje"]}), 500
+            return jsonify({"error": respuesta["mensaje"], "codigo_error": respuesta.get("codigo_error")}), 500
         return jsonify({"mensaje": f"Evento ({data['titulo_evento']}) actualizado"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/events/<int:id_evento>", methods=["DELETE"])
+@eventos_bp.route("/events/<int:id_evento>", methods=["DELETE"])
 def delete_event_by_id(id_evento):
     """
     Elimina un evento específico basado en su ID.
@@ -174,14 +258,14 @@ def delete_event_by_id(id_evento):
     >>>     {"error": "Mensaje de error"}
     """
     try:
-        respuesta = gestor_eventos.delete_event_by_id(id_evento)
+        respuesta = obtener_gestor_eventos().delete_event_by_id(id_evento)
         if respuesta["codigo"] == 500:
             return jsonify({"error": respuesta["mensaje"]}), 500
         return jsonify({"mensaje": f"Evento ({respuesta['data']['titulo_evento']}) eliminado"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
     
-@app.route("/locations", methods=["GET"])
+@eventos_bp.route("/locations", methods=["GET"])
 def get_locations():
     """
     Obtenemos todas las ubicaciones registradas en la base de datos.
@@ -203,7 +287,39 @@ def get_locations():
     >>>     {"error": "Mensaje de error"}
     """
     try:
-        respuesta = gestor_eventos.gestor_ubicacion.get_ubicaciones()
+        respuesta = obtener_gestor_eventos().gestor_ubicacion.get_ubicaciones()
+        if respuesta["codigo"] == 500:
+            return jsonify({"error": respuesta["mensaje"]}), 500
+        return jsonify({"data": respuesta["registro"]}), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@eventos_bp.route("/stats", methods=["GET"])
+def get_stats():
+    """
+    Obtiene el número de eventos por ubicación, día y mes, y la ocupación de los espacios de 2 horas
+    entre las 8:00 am y las 10:00 pm. Los contadores se mantienen con cada cambio, sin recorrer los eventos.
+
+    Returns:
+        Response: Un objeto JSON con las estadísticas y el código de estado HTTP correspondiente.
+
+    JSON Request Body:
+        None.
+    JSON Response:
+    >>> 200 OK:
+    >>>     {"data": {
+    >>>         "total": int,
+    >>>         "por_ubicacion": {"0": int, ...},
+    >>>         "por_dia": {"YYYY-MM-DD": int, ...},
+    >>>         "por_mes": {"YYYY-MM": int, ...},
+    >>>         "ocupacion": {"total": float, "por_ubicacion": {"0": float, ...}, "por_dia": {"YYYY-MM-DD": float, ...}}
+    >>>     }}
+    >>> 500 Internal Server Error:
+    >>>     {"error": "Mensaje de error"}
+    """
+    try:
+        respuesta = obtener_gestor_eventos().estadisticas.get_stats()
         if respuesta["codigo"] == 500:
             return jsonify({"error": respuesta["mensaje"]}), 500
         return jsonify({"data": respuesta["registro"]}), 200
@@ -211,5 +327,9 @@ def get_locations():
         return jsonify({"error": str(e)}), 500
 
 
+app = crear_app()
+
 if __name__ == "__main__":
-    app.run(debug=True)
+    # El archivador arranca con el gestor, en la primera petición; con debug=True solo el proceso
+    # que atiende las peticiones lo crea, no el del recargador.
+    crear_app({"ARCHIVAR": True}).run(debug=True)
@@ -1,14 +1,129 @@
 import json
 import traceback
-import copy
+import gzip
+import os
+import tempfile
+import threading
+from collections import ChainMap
+from contextlib import contextmanager
 from datetime import datetime, timedelta, time
+try:
+    import fcntl
+except ImportError:
+    # Windows no tiene flock; ahí el bloqueo entre procesos no aplica
+    fcntl = None
+
+
+class ValidadorEvento:
+    def __init__(self, maximo_tiempo_Y: int = 2, hora_minima: time = time(8, 0, 0),
+                 hora_maxima: time = time(22, 0, 0)):
+        """
+        Reglas de validación de un evento, comunes a la creación, la actualización y la importación masiva.
+        Las reglas se arman una sola vez y validar() devuelve el primer error encontrado en vez de lanzar
+        una excepción, para que rechazar un evento cueste lo mismo que aceptarlo.
+
+        Args:
+            maximo_tiempo_Y (int): Años hacia adelante en los que se puede programar un evento.
+            hora_minima (time): Hora mínima del evento.
+            hora_maxima (time): Hora máxima del evento.
+
+        Example:
+        >>> validador = ValidadorEvento()
+        >>> fecha = datetime.strptime("2021-10-10 08:00:00", "%Y-%m-%d %H:%M:%S")
+        >>> error = validador.validar("Evento 1", fecha, "Descripción del evento 1", 1, 3)
+        """
+        maximo_tiempo = timedelta(days=(365*maximo_tiempo_Y))
+        # Cada regla es (codigo_error, mensaje, condición que debe cumplirse), en orden de evaluación
+        self.reglas = [
+            ("CAMPOS_VACIOS", "Los campos no pueden estar vacíos",
+             lambda evento: isinstance(evento["titulo_evento"], str) and isinstance(evento["descripcion_evento"], str)
+             and evento["titulo_evento"].strip() != "" and evento["descripcion_evento"].strip() != ""),
+            ("FECHA_INVALIDA", "La fecha y hora del evento debe ser de tipo datetime",
+             lambda evento: isinstance(evento["fecha_hora_evento"], datetime)),
+            ("FECHA_PASADA", "La fecha y hora del evento no puede ser menor a la fecha y hora actual",
+             lambda evento: evento["fecha_hora_evento"] >= evento["fecha_actual"]),
+            ("FECHA_LEJANA", "La fecha y hora del evento no puede ser mayor a dos años desde la fecha y hora actual",
+             lambda evento: evento["fecha_hora_evento"] <= evento["fecha_actual"] + maximo_tiempo),
+            ("HORA_FUERA_DE_RANGO", "La hora del evento debe ser entre las 8:00 am y las 10:00 pm",
+             lambda evento: hora_minima <= evento["fecha_hora_evento"].time() <= hora_maxima),
+            ("HORA_NO_PERMITIDA", "La hora del evento debe ser múltiplo de 2, y los minutos y segundos deben ser ceros",
+             lambda evento: evento["fecha_hora_evento"].hour % 2 == 0 and evento["fecha_hora_evento"].minute == 0
+             and evento["fecha_hora_evento"].second == 0),
+            ("UBICACION_NO_EXISTE", "La ubicación del evento no existe",
+             lambda evento: isinstance(evento["ubicacion_evento"], int)
+             and 0 <= evento["ubicacion_evento"] < evento["cantidad_ubicaciones"]),
+        ]
+
+    def validar(self, titulo_evento: str, fecha_hora_evento: datetime, descripcion_evento: str,
+                ubicacion_evento: int, cantidad_ubicaciones: int, fecha_actual: datetime = None) -> dict:
+        """
+        Validar los campos de un evento sin consultar la base de datos.
+
+        Args:
+            titulo_evento (str): Título del evento.
+            fecha_hora_evento (datetime): Fecha y hora del evento.
+            descripcion_evento (str): Descripción del evento.
+            ubicacion_evento (int): Ubicación del evento.
+            cantidad_ubicaciones (int): Número de ubicaciones registradas.
+            fecha_actual (datetime): Fecha de referencia. Si es None se usa datetime.now().
+
+        Returns:
+            dict: None si el evento es válido, o el primer error encontrado.
+            {"codigo_error": "FECHA_PASADA", "mensaje": "Mensaje de error"}
+        """
+        evento = {"titulo_evento": titulo_evento, "fecha_hora_evento": fecha_hora_evento,
+                  "descripcion_evento": descripcion_evento, "ubicacion_evento": ubicacion_evento,
+                  "cantidad_ubicaciones": cantidad_ubicaciones,
+                  "fecha_actual": fecha_actual if fecha_actual is not None else datetime.now()}
+        for codigo_error, mensaje, condicion in self.reglas:
+            if not condicion(evento):
+                return {"codigo_error": codigo_error, "mensaje": mensaje}
+        return None
+
+    def validar_espacio(self, ubicacion_evento: int, fecha_hora_evento: str, ocupados: dict,
+                        id_evento: int = None) -> dict:
+        """
+        Validar que la ubicación esté libre en la fecha y hora del evento.
+
+        Args:
+            ubicacion_evento (int): Ubicación del evento.
+            fecha_hora_evento (str): Fecha y hora del evento en formato "%Y-%m-%d %H:%M:%S".
+            ocupados (dict): Index del evento que ocupa cada (ubicacion_evento, fecha_hora_evento).
+            id_evento (int): ID del evento que se actualiza, que puede conservar su propio espacio.
+
+        Returns:
+            dict: None si el espacio está libre, o el error.
+            {"codigo_error": "ESPACIO_OCUPADO", "mensaje": "Mensaje de error"}
+        """
+        ocupante = ocupados.get((ubicacion_evento, fecha_hora_evento))
+        if ocupante is not None and ocupante != id_evento:
+            return {"codigo_error": "ESPACIO_OCUPADO",
+                    "mensaje": "La ubicación y fecha del evento ya están ocupadas por otro evento"}
+        return None
 
 
 class GestionEventos:
-    def __init__(self):
-        self.gestor_json = GestorJson()
-        self.gestor_ubicacion = GestorUbicacion()
+    def __init__(self, nombre_archivo: str = "data_base.json",
+                 nombre_archivo_frio: str = "data_base_archivo.jsonl.gz", backend: str = "json"):
+        """
+        Args:
+            nombre_archivo (str): Ruta de la base de datos.
+            nombre_archivo_frio (str): Ruta del almacén frío de eventos archivados.
+            backend (str): Nombre del gestor de base de datos, una de las llaves de BACKENDS.
+
+        Example:
+        >>> gestion = GestionEventos("data_base.json")
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend '{backend}' no soportado")
+        self.gestor_json = BACKENDS[backend](nombre_archivo)
+        self.gestor_ubicacion = GestorUbicacion(self.gestor_json)
+        self.gestor_archivo = GestorArchivo(nombre_archivo_frio)
+        self.validador = ValidadorEvento()
         self.tabla = "eventos"
+        self.estadisticas = EstadisticasEventos(self.gestor_json, self.tabla)
+        self.espacios = EspaciosOcupados(self.gestor_json, self.tabla)
+        self.cache_json = CacheEventosJson(self.gestor_json, self.tabla)
 
     def post_events(self, titulo_evento: str, fecha_hora_evento: datetime, descripcion_evento: str,
                     ubicacion_evento: int) -> dict:
@@ -25,6 +140,7 @@ class GestionEventos:
         Returns:
             dict: Mensaje de éxito o error.
             {"mensaje": "Evento creado", "codigo": 200} o
+            {"codigo_error": "FECHA_PASADA", "mensaje": "Mensaje de error", "codigo": 500} si el evento no es válido o
             {"mensaje": "Mensaje de error", "codigo": 500,
                 "info": "Informacion adicional del error"}
 
@@ -34,62 +150,103 @@ class GestionEventos:
         >>> respuesta = gestion.post_events("Evento 1", fecha, "Descripción del evento 1", 1)
         """
         try:
-            # Validacion de valores vacios
             titulo_evento = titulo_evento.replace("\n", "")
-            if titulo_evento.strip() == "" or descripcion_evento.strip() == "":
-                raise ValueError("Los campos no pueden estar vacíos")
-
-            # Validacion de fecha y hora
-            maximo_tiempo_Y = 2
-            fecha_actual = datetime.now()
-            if fecha_hora_evento < fecha_actual:
-                raise ValueError(
-                    "La fecha y hora del evento no puede ser menor a la fecha y hora actual")
-
-            fecha_maxima = fecha_actual + \
-                timedelta(days=(365*maximo_tiempo_Y))
-            if fecha_hora_evento > fecha_maxima:
-                raise ValueError(
-                    "La fecha y hora del evento no puede ser mayor a dos años desde la fecha y hora actual")
-
-            hora_minima = time(8, 0, 0)
-            hora_maxima = time(22, 0, 0)
-            if fecha_hora_evento.time() < hora_minima or fecha_hora_evento.time() > hora_maxima:
-                raise ValueError(
-                    "La hora del evento debe ser entre las 8:00 am y las 10:00 pm")
-
-            if fecha_hora_evento.hour % 2 != 0 or fecha_hora_evento.minute != 0 or fecha_hora_evento.second != 0:
-                raise ValueError(
-                    "La hora del evento debe ser múltiplo de 2, y los minutos y segundos deben ser ceros")
-
-            # Validacion de ubicacion
             ubicaciones = self.gestor_ubicacion.get_ubicaciones()
             if ubicaciones["codigo"] == 500:
                 raise ValueError(ubicaciones["mensaje"])
 
-            if ubicacion_evento < 0 or ubicacion_evento >= len(ubicaciones["registro"]):
-                raise ValueError("La ubicación del evento no existe")
+            error = self.validador.validar(titulo_evento, fecha_hora_evento, descripcion_evento,
+                                           ubicacion_evento, len(ubicaciones["registro"]))
+            if error is not None:
+                return {**error, "codigo": 500}
+
+            fecha_hora_str = fecha_hora_evento.strftime("%Y-%m-%d %H:%M:%S")
+            # Con lock_escritura tomado ninguna otra escritura puede ocupar el espacio entre la validación y la creación
+            with self.gestor_json.lock_escritura:
+                error = self.validador.validar_espacio(
+                    ubicacion_evento, fecha_hora_str, self.espacios_ocupados())
+                if error is not None:
+                    return {**error, "codigo": 500}
+
+                respuesta = self.gestor_json.crear(self.tabla,
+                                                   ["titulo_evento", "fecha_hora_evento",
+                                                       "descripcion_evento", "ubicacion_evento"],
+                                                   [titulo_evento, fecha_hora_str, descripcion_evento, ubicacion_evento])
+            return respuesta
+        except Exception as e:
+            return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
 
-            eventos = self.gestor_json.buscar(self.tabla)
-            if eventos["codigo"] == 500:
-                raise ValueError(eventos["mensaje"])
+    def espacios_ocupados(self) -> dict:
+        """
+        Obtener el index del evento que ocupa cada par (ubicacion_evento, fecha_hora_evento).
+        Es el mapa que mantiene EspaciosOcupados, no una copia: solo es consistente mientras se tiene
+        gestor_json.lock_escritura y no se debe modificar.
+
+        Returns:
+            dict: {(ubicacion_evento, fecha_hora_evento): index, ...}
 
-            for evento in eventos["registro"]:
-                if evento["ubicacion_evento"] == ubicacion_evento and evento["fecha_hora_evento"] == fecha_hora_evento.strftime("%Y-%m-%d %H:%M:%S"):
-                    raise ValueError(
-                        "La ubicación y fecha del evento ya están ocupadas por otro evento")
+        Raises:
+            ValueError: Si no se pueden leer los eventos.
+        """
+        self.espacios.cargar()
+        return self.espacios.ocupados
 
-            respuesta = self.gestor_json.crear(self.tabla,
-                                               ["titulo_evento", "fecha_hora_evento",
-                                                   "descripcion_evento", "ubicacion_evento"],
-                                               [titulo_evento, fecha_hora_evento.strftime("%Y-%m-%d %H:%M:%S"), descripcion_evento, ubicacion_evento])
-            return respuesta
+    def post_events_lote(self, eventos: list[dict]) -> dict:
+        """
+        Crear varios eventos con una sola escritura del archivo.
+        Los eventos deben venir ya validados con ValidadorEvento.validar; aquí solo se valida la disponibilidad
+        de la ubicación, contra los eventos registrados y contra los del mismo lote.
+
+        Args:
+            eventos (list[dict]): Eventos con los campos "titulo_evento", "fecha_hora_evento" (str en formato
+                "%Y-%m-%d %H:%M:%S"), "descripcion_evento" y "ubicacion_evento".
+
+        Returns:
+            dict: Mensaje de éxito con los eventos rechazados o mensaje de error.
+            {"mensaje": "Eventos creados", "creados": 10,
+                "rechazados": [{"posicion": 3, "codigo_error": "ESPACIO_OCUPADO", "mensaje": "..."}], "codigo": 200} o
+            {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
+
+        Example:
+        >>> gestion = GestionEventos()
+        >>> respuesta = gestion.post_events_lote([{"titulo_evento": "Evento 1",
+        >>>     "fecha_hora_evento": "2021-10-10 08:00:00", "descripcion_evento": "Descripción", "ubicacion_evento": 1}])
+        """
+        try:
+            campos = ["titulo_evento", "fecha_hora_evento",
+                      "descripcion_evento", "ubicacion_evento"]
+            valores = []
+            rechazados = []
+            with self.gestor_json.lock_escritura:
+                # Los espacios que ocupa el lote van en su propio dict para no tocar el mapa compartido
+                ocupados = ChainMap({}, self.espacios_ocupados())
+                for posicion, evento in enumerate(eventos):
+                    error = self.validador.validar_espacio(
+                        evento["ubicacion_evento"], evento["fecha_hora_evento"], ocupados)
+                    if error is not None:
+                        rechazados.append({"posicion": posicion, **error})
+                        continue
+                    # El index definitivo lo asigna crear_varios; basta con que no coincida con ningún id_evento
+                    ocupados[(evento["ubicacion_evento"],
+                              evento["fecha_hora_evento"])] = -1
+                    valores.append([evento[campo] for campo in campos])
+
+                respuesta = self.gestor_json.crear_varios(
+                    self.tabla, campos, valores)
+            if respuesta["codigo"] == 500:
+                raise ValueError(respuesta["mensaje"])
+            return {"mensaje": "Eventos creados", "creados": len(valores), "rechazados": rechazados, "codigo": 200}
         except Exception as e:
             return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
 
-    def get_events(self) -> dict:
+    def get_events(self, incluir_archivados: bool = False) -> dict:
         """
         Obtener todos los eventos.
+        Por defecto solo se devuelven los eventos vigentes; los archivados se leen del almacén frío
+        únicamente si se solicitan.
+
+        Args:
+            incluir_archivados (bool): Si es True, se agregan los eventos archivados al inicio del registro.
 
         Returns:
             dict: Registro con mensaje de éxito o mensaje de error.
@@ -108,10 +265,16 @@ class GestionEventos:
             ubicaciones = self.gestor_ubicacion.get_ubicaciones()
             if ubicaciones["codigo"] == 500:
                 raise ValueError(ubicaciones["mensaje"])
+            registros = respuesta["registro"]
+            if incluir_archivados:
+                archivados = self.gestor_archivo.buscar(self.tabla)
+                if archivados["codigo"] == 500:
+                    raise ValueError(archivados["mensaje"])
+                registros = archivados["registro"] + list(registros)
             eventos_modificados = []
-            for evento in respuesta["registro"]:
-                # Crear una copia profunda del evento
-                evento_copia = copy.deepcopy(evento)
+            for evento in registros:
+                # Los registros de GestorJson nunca se modifican, así que basta una copia superficial
+                evento_copia = dict(evento)
                 evento_copia["ubicacion_evento"] = ubicaciones["registro"][evento["ubicacion_evento"]]
                 eventos_modificados.append(evento_copia)
             respuesta["registro"] = eventos_modificados
@@ -119,6 +282,49 @@ class GestionEventos:
         except Exception as e:
             return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
 
+    def archivar_eventos(self, horizonte_dias: int = 0) -> dict:
+        """
+        Mover al almacén frío los eventos cuya fecha sea anterior a la fecha actual menos el horizonte.
+        Los eventos archivados dejan de participar en las validaciones de disponibilidad y en get_events.
+
+        Args:
+            horizonte_dias (int): Días que se conserva un evento pasado antes de archivarlo.
+
+        Returns:
+            dict: Mensaje de éxito o error.
+            {"mensaje": "Eventos archivados", "cantidad": 3, "codigo": 200} o
+            {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
+
+        Example:
+        >>> gestion = GestionEventos()
+        >>> respuesta = gestion.archivar_eventos(30)
+        """
+        try:
+            limite = (datetime.now() - timedelta(days=horizonte_dias)
+                      ).strftime("%Y-%m-%d %H:%M:%S")
+            # Con lock_escritura tomado ningún evento vencido puede actualizarse entre la selección y la extracción
+            with self.gestor_json.lock_escritura:
+                eventos = self.gestor_json.buscar(self.tabla)
+                if eventos["codigo"] == 500:
+                    raise ValueError(eventos["mensaje"])
+                vencidos = [evento for evento in eventos["registro"]
+                            if evento["fecha_hora_evento"] < limite]
+
+                # Primero se escribe en el almacén frío, así un fallo no deja eventos sin copia
+                archivados = self.gestor_archivo.agregar(self.tabla, vencidos)
+                if archivados["codigo"] == 500:
+                    raise ValueError(archivados["mensaje"])
+
+                # Se extrae exactamente el registro archivado, no lo que tenga su index
+                ids_vencidos = {id(evento) for evento in vencidos}
+                respuesta = self.gestor_json.extraer(
+                    self.tabla, lambda evento: id(evento) in ids_vencidos)
+                if respuesta["codigo"] == 500:
+                    raise ValueError(respuesta["mensaje"])
+            return {"mensaje": "Eventos archivados", "cantidad": len(respuesta["registro"]), "codigo": 200}
+        except Exception as e:
+            return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
+
     def get_event_by_id(self, id_evento: int) -> dict:
         """
         Buscar un evento por su ID.
@@ -142,7 +348,7 @@ class GestionEventos:
             ubicaciones = self.gestor_ubicacion.get_ubicaciones()
             if ubicaciones["codigo"] == 500:
                 raise ValueError(ubicaciones["mensaje"])
-            evento_copia = copy.deepcopy(respuesta["registro"][0])
+            evento_copia = dict(respuesta["registro"][0])
             evento_copia["ubicacion_evento"] = ubicaciones["registro"][respuesta["registro"]
                                                                        [0]["ubicacion_evento"]]
             respuesta["registro"][0] = evento_copia
@@ -150,6 +356,77 @@ class GestionEventos:
         except Exception as e:
             return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
 
+    def get_events_serializados(self, incluir_archivados: bool = False) -> dict:
+        """
+        Obtener todos los eventos, con la ubicación incluida, ya codificados en JSON.
+        Igual que get_events, pero cada evento es un fragmento bytes tomado de CacheEventosJson, de modo que
+        solo se codifican los eventos que cambiaron desde la última consulta. Los archivados no se guardan en caché.
+
+        Args:
+            incluir_archivados (bool): Si es True, se agregan los eventos archivados al inicio del registro.
+
+        Returns:
+            dict: Registro con mensaje de éxito o mensaje de error.
+            {"registro": [b'{"descripcion_evento":...}', ...], "mensaje": "Registros encontrados", "codigo": 200} o
+            {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
+
+        Example:
+        >>> gestion = GestionEventos()
+        >>> respuesta = gestion.get_events_serializados()
+        >>> cuerpo = b"[" + b",".join(respuesta["registro"]) + b"]"
+        """
+        try:
+            respuesta = self.gestor_json.buscar(self.tabla)
+            if respuesta["codigo"] == 500:
+                raise ValueError(respuesta["mensaje"])
+            ubicaciones = self.gestor_ubicacion.get_ubicaciones()
+            if ubicaciones["codigo"] == 500:
+                raise ValueError(ubicaciones["mensaje"])
+            fragmentos = []
+            if incluir_archivados:
+                archivados = self.gestor_archivo.buscar(self.tabla)
+                if archivados["codigo"] == 500:
+                    raise ValueError(archivados["mensaje"])
+                for evento in archivados["registro"]:
+                    evento_copia = dict(evento)
+                    evento_copia["ubicacion_evento"] = ubicaciones["registro"][evento["ubicacion_evento"]]
+                    fragmentos.append(self.cache_json.codificar(evento_copia))
+            for evento in respuesta["registro"]:
+                fragmentos.append(self.cache_json.fragmento(
+                    evento, ubicaciones["registro"]))
+            return {"registro": fragmentos, "mensaje": "Registros encontrados", "codigo": 200}
+        except Exception as e:
+            return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
+
+    def get_event_by_id_serializado(self, id_evento: int) -> dict:
+        """
+        Buscar un evento por su ID y devolverlo ya codificado en JSON, tomado de CacheEventosJson.
+
+        Args:
+            id_evento (int): ID del evento a buscar.
+
+        Returns:
+            dict: Registro con mensaje de éxito o mensaje de error.
+            {"registro": [b'{"descripcion_evento":...}'], "mensaje": "Registro encontrado", "codigo": 200} o
+            {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
+
+        Example:
+        >>> gestion = GestionEventos()
+        >>> respuesta = gestion.get_event_by_id_serializado(1)
+        """
+        try:
+            respuesta = self.gestor_json.buscar(self.tabla, id_evento)
+            if respuesta["codigo"] in [500, 404]:
+                raise ValueError(respuesta["mensaje"])
+            ubicaciones = self.gestor_ubicacion.get_ubicaciones()
+            if ubicaciones["codigo"] == 500:
+                raise ValueError(ubicaciones["mensaje"])
+            respuesta["registro"] = [self.cache_json.fragmento(
+                respuesta["registro"][0], ubicaciones["registro"])]
+            return respuesta
+        except Exception as e:
+            return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
+
     def put_event_by_id(self, titulo_evento: str, fecha_hora_evento: datetime,
                         descripcion_evento: str, ubicacion_evento: str, id_evento: int) -> dict:
         """
@@ -166,6 +443,7 @@ class GestionEventos:
         Returns:
             dict: Mensaje de éxito o error.
             {"mensaje": "Evento actualizado", "codigo": 200} o
+            {"codigo_error": "FECHA_PASADA", "mensaje": "Mensaje de error", "codigo": 500} si el evento no es válido o
             {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
 
         Example:
@@ -176,58 +454,33 @@ class GestionEventos:
         try:
             # Validacion de existencia
             eventos = self.gestor_json.buscar(self.tabla, id_evento)
-            if eventos["codigo"] in [404, 500]:
+            if eventos["codigo"] == 500:
                 raise ValueError(eventos["mensaje"])
+            if eventos["codigo"] == 404:
+                return {"codigo_error": "EVENTO_NO_EXISTE", "mensaje": eventos["mensaje"], "codigo": 500}
 
-            # Validacion de valores vacios
             titulo_evento = titulo_evento.replace("\n", "")
-            if titulo_evento.strip() == "" or descripcion_evento.strip() == "":
-                raise ValueError("Los campos no pueden estar vacíos")
-
-            # Validacion de fecha y hora
-            maximo_tiempo_Y = 2
-            fecha_actual = datetime.now()
-            if fecha_hora_evento < fecha_actual:
-                raise ValueError(
-                    "La fecha y hora del evento no puede ser menor a la fecha y hora actual")
-
-            fecha_maxima = fecha_actual + \
-                timedelta(days=(365*maximo_tiempo_Y))
-            if fecha_hora_evento > fecha_maxima:
-                raise ValueError(
-                    "La fecha y hora del evento no puede ser mayor a dos años desde la fecha y hora actual")
-
-            hora_minima = time(8, 0, 0)
-            hora_maxima = time(22, 0, 0)
-            if fecha_hora_evento.time() < hora_minima or fecha_hora_evento.time() > hora_maxima:
-                raise ValueError(
-                    "La hora del evento debe ser entre las 8:00 am y las 10:00 pm")
-
-            if fecha_hora_evento.hour % 2 != 0 or fecha_hora_evento.minute != 0 or fecha_hora_evento.second != 0:
-                raise ValueError(
-                    "La hora del evento debe ser múltiplo de 2, y los minutos y segundos deben ser ceros")
-
-            # Validacion de ubicacion
             ubicaciones = self.gestor_ubicacion.get_ubicaciones()
             if ubicaciones["codigo"] == 500:
                 raise ValueError(ubicaciones["mensaje"])
 
-            if ubicacion_evento < 0 or ubicacion_evento >= len(ubicaciones["registro"]):
-                raise ValueError("La ubicación del evento no existe")
-
-            eventos = self.gestor_json.buscar(self.tabla)
-            if eventos["codigo"] == 500:
-                raise ValueError(eventos["mensaje"])
-
-            for evento in eventos["registro"]:
-                if evento["ubicacion_evento"] == ubicacion_evento and evento["fecha_hora_evento"] == fecha_hora_evento.strftime("%Y-%m-%d %H:%M:%S") and evento["index"] != id_evento:
-                    raise ValueError(
-                        "La ubicación y fecha del evento ya están ocupadas por otro evento")
-
-            respuesta = self.gestor_json.actualizar(self.tabla,
-                                                    ["titulo_evento", "fecha_hora_evento",
-                                                        "descripcion_evento", "ubicacion_evento"],
-                                                    [titulo_evento, fecha_hora_evento.strftime("%Y-%m-%d %H:%M:%S"), descripcion_evento, ubicacion_evento], id_evento)
+            error = self.validador.validar(titulo_evento, fecha_hora_evento, descripcion_evento,
+                                           ubicacion_evento, len(ubicaciones["registro"]))
+            if error is not None:
+                return {**error, "codigo": 500}
+
+            fecha_hora_str = fecha_hora_evento.strftime("%Y-%m-%d %H:%M:%S")
+            # Con lock_escritura tomado ninguna otra escritura puede ocupar el espacio entre la validación y la actualización
+            with self.gestor_json.lock_escritura:
+                error = self.validador.validar_espacio(
+                    ubicacion_evento, fecha_hora_str, self.espacios_ocupados(), id_evento)
+                if error is not None:
+                    return {**error, "codigo": 500}
+
+                respuesta = self.gestor_json.actualizar(self.tabla,
+                                                        ["titulo_evento", "fecha_hora_evento",
+                                                            "descripcion_evento", "ubicacion_evento"],
+                                                        [titulo_evento, fecha_hora_str, descripcion_evento, ubicacion_evento], id_evento)
             return respuesta
 
         except Exception as e:
@@ -260,9 +513,37 @@ class GestionEventos:
 
 
 class GestorJson:
-    def __init__(self):
-        self.nombre_archivo = "data_base.json"
-        self.archivo_json = self.leer_archivo()
+    def __init__(self, nombre_archivo: str = "data_base.json"):
+        """
+        Las tablas se guardan como tuplas que nunca se modifican: cada escritura arma una tupla nueva y reemplaza
+        la referencia (copia en escritura). Así buscar() entrega una instantánea consistente sin copiarla ni
+        bloquear, y las versiones viejas se liberan cuando ningún lector las referencia. Los registros (dict)
+        tampoco se modifican nunca; actualizar los reemplaza por uno nuevo.
+        Las escrituras se serializan entre sí con lock_escritura, pero no esperan a los lectores.
+
+        Args:
+            nombre_archivo (str): Ruta de la base de datos.
+        """
+        self.nombre_archivo = nombre_archivo
+        self._archivo_json = None
+        self._lock_carga = threading.Lock()
+        self.lock_escritura = threading.RLock()
+        self.suscriptores = []
+
+    @property
+    def archivo_json(self) -> dict:
+        """
+        Contenido de la base de datos. El archivo se lee la primera vez que se accede, no al construir el gestor.
+        """
+        if self._archivo_json is None:
+            with self._lock_carga:
+                if self._archivo_json is None:
+                    archivo_json = self.leer_archivo()
+                    for tabla, registros in archivo_json.items():
+                        if isinstance(registros, list):
+                            archivo_json[tabla] = tuple(registros)
+                    self._archivo_json = archivo_json
+        return self._archivo_json
 
     def leer_archivo(self) -> dict:
         """
@@ -295,6 +576,32 @@ class GestorJson:
         with open(self.nombre_archivo, "w", encoding="utf-8") as archivo:
             archivo.write(json.dumps(self.archivo_json, indent=4))
 
+    def suscribir(self, funcion) -> None:
+        """
+        Registrar una función que se llama después de cada cambio en un registro.
+        La función recibe (tabla, anterior, nuevo): anterior es None al crear y nuevo es None al borrar o extraer.
+
+        Args:
+            funcion (Callable[[str, dict, dict], None]): Función a llamar.
+
+        Example:
+        >>> gestor = GestorJson()
+        >>> gestor.suscribir(lambda tabla, anterior, nuevo: print(tabla, anterior, nuevo))
+        """
+        self.suscriptores.append(funcion)
+
+    def notificar(self, tabla: str, anterior: dict, nuevo: dict) -> None:
+        """
+        Avisar a los suscriptores de un cambio en un registro.
+
+        Args:
+            tabla (str): Nombre de la tabla.
+            anterior (dict): Registro antes del cambio, o None si se creó.
+            nuevo (dict): Registro después del cambio, o None si se eliminó.
+        """
+        for funcion in self.suscriptores:
+            funcion(tabla, anterior, nuevo)
+
     def crear(self, tabla: str, campos: list[str], valores: list[str]) -> dict:
         """
         Crear un registro en la base de datos (JSON).
@@ -316,19 +623,121 @@ class GestorJson:
         >>> ["Evento 1", "2021-10-10", "Descripción del evento 1", "Ubicación del evento 1"])
         """
         try:
-            nuevo_index = (self.archivo_json[tabla][-1]["index"])+1
-            dict_temporal = dict(zip(campos, valores))
-            dict_temporal["index"] = nuevo_index
-            self.archivo_json[tabla].append(dict_temporal)
-            self.escribir_archivo()
+            with self.lock_escritura:
+                nuevo_index = self.siguiente_index(tabla)
+                dict_temporal = dict(zip(campos, valores))
+                dict_temporal["index"] = nuevo_index
+                self.archivo_json[tabla] = self.archivo_json[tabla] + \
+                    (dict_temporal,)
+                self.escribir_archivo()
+                self.notificar(tabla, None, dict_temporal)
             return {"mensaje": "Registro creado", "codigo": 200}
         except Exception as e:
             return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
 
+    def crear_varios(self, tabla: str, campos: list[str], lista_valores: list[list]) -> dict:
+        """
+        Crear varios registros en la base de datos (JSON) escribiendo el archivo una sola vez.
+
+        Args:
+            tabla (str): Nombre de la tabla.
+            campos (list[str]): Lista con los nombres de los campos.
+            lista_valores (list[list]): Lista con los valores de cada registro, en el orden de campos.
+
+        Returns:
+            dict: Mensaje de éxito o error.
+            {"mensaje": "Registros creados", "codigo": 200} o
+            {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
+
+        Example:
+        >>> gestor = GestorJson()
+        >>> gestor.crear_varios("eventos",
+        >>> ["titulo_evento", "fecha_hora_evento", "descripcion_evento", "ubicacion_evento"],
+        >>> [["Evento 1", "2021-10-10", "Descripción del evento 1", 1],
+        >>>  ["Evento 2", "2021-10-11", "Descripción del evento 2", 2]])
+        """
+        try:
+            if not lista_valores:
+                return {"mensaje": "Registros creados", "codigo": 200}
+            with self.lock_escritura:
+                nuevo_index = self.siguiente_index(tabla)
+                nuevos = []
+                for valores in lista_valores:
+                    dict_temporal = dict(zip(campos, valores))
+                    dict_temporal["index"] = nuevo_index
+                    nuevos.append(dict_temporal)
+                    nuevo_index += 1
+                self.archivo_json[tabla] = self.archivo_json[tabla] + \
+                    tuple(nuevos)
+                self.escribir_archivo()
+                for nuevo in nuevos:
+                    self.notificar(tabla, None, nuevo)
+            return {"mensaje": "Registros creados", "codigo": 200}
+        except Exception as e:
+            return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
+
+    def siguiente_index(self, tabla: str) -> int:
+        """
+        Calcular el index del próximo registro de una tabla.
+        Se tiene en cuenta el último index extraído para no reutilizar los index de registros archivados.
+
+        Args:
+            tabla (str): Nombre de la tabla.
+
+        Returns:
+            int: Index disponible para un nuevo registro.
+
+        Example:
+        >>> gestor = GestorJson()
+        >>> gestor.siguiente_index("eventos")
+        """
+        registros = self.archivo_json[tabla]
+        ultimo_extraido = self.archivo_json.get("secuencias", {}).get(tabla, 0)
+        ultimo_registro = registros[-1]["index"] if registros else 0
+        return max(ultimo_extraido, ultimo_registro) + 1
+
+    def extraer(self, tabla: str, condicion) -> dict:
+        """
+        Quitar de una tabla todos los registros que cumplan una condición, escribiendo el archivo una sola vez.
+
+        Args:
+            tabla (str): Nombre de la tabla.
+            condicion (Callable[[dict], bool]): Función que indica si un registro debe extraerse.
+
+        Returns:
+            dict: Registros extraídos con mensaje de éxito o mensaje de error.
+            {"registro": [{"campo1": "valor1", ...}, ...], "mensaje": "Registros extraidos", "codigo": 200} o
+            {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
+
+        Example:
+        >>> gestor = GestorJson()
+        >>> gestor.extraer("eventos", lambda evento: evento["ubicacion_evento"] == 1)
+        """
+        try:
+            with self.lock_escritura:
+                extraidos = []
+                conservados = []
+                for registro in self.archivo_json[tabla]:
+                    if condicion(registro):
+                        extraidos.append(registro)
+                    else:
+                        conservados.append(registro)
+                if extraidos:
+                    secuencias = self.archivo_json.setdefault("secuencias", {})
+                    secuencias[tabla] = self.siguiente_index(tabla) - 1
+                    self.archivo_json[tabla] = tuple(conservados)
+                    self.escribir_archivo()
+                    for registro in extraidos:
+                        self.notificar(tabla, registro, None)
+            return {"registro": extraidos, "mensaje": "Registros extraidos", "codigo": 200}
+        except Exception as e:
+            return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
+
     def buscar(self, tabla: str, id: int = None) -> dict:
         """
         Buscar un registro específico en la base de datos (JSON).
-        Si no se especifica un ID, se toma como None y se devuelven todos los registros.
+        Si no se especifica un ID, se toma como None y se devuelven todos los registros como una tupla inmutable:
+        es la instantánea de la tabla en ese momento y no cambia aunque haya escrituras mientras se recorre.
 
         Args:
             tabla (str): Nombre de la tabla en la base de datos.
@@ -343,11 +752,12 @@ class GestorJson:
         >>> gestor = GestorJson()
         """
         try:
+            registros = self.archivo_json[tabla]
             if id is None:
-                return {"registro": self.archivo_json[tabla], "mensaje": "Registros encontrados", "codigo": 200}
-            elif 0 < id <= self.archivo_json[tabla][-1]["index"]:
+                return {"registro": registros, "mensaje": "Registros encontrados", "codigo": 200}
+            elif registros and 0 < id <= registros[-1]["index"]:
                 registro = next(
-                    filter(lambda item: item['index'] == id, self.archivo_json[tabla]), None)
+                    filter(lambda item: item['index'] == id, registros), None)
                 if registro == None:
                     return {"registro": [], "mensaje": "Registro no encontrado", "codigo": 404}
                 else:
@@ -380,15 +790,19 @@ class GestorJson:
         >>> 1)
         """
         try:
-            respuesta = self.buscar(tabla, id)
-            if respuesta["codigo"] == 500:
-                raise ValueError(respuesta["mensaje"])
-            item = respuesta["registro"][0]
-            index_lista = self.archivo_json[tabla].index(item)
-            dict_temporal = dict(zip(campos, valores))
-            dict_temporal["index"] = item["index"]
-            self.archivo_json[tabla][index_lista] = dict_temporal
-            self.escribir_archivo()
+            with self.lock_escritura:
+                respuesta = self.buscar(tabla, id)
+                if respuesta["codigo"] == 500:
+                    raise ValueError(respuesta["mensaje"])
+                item = respuesta["registro"][0]
+                registros = self.archivo_json[tabla]
+                index_lista = registros.index(item)
+                dict_temporal = dict(zip(campos, valores))
+                dict_temporal["index"] = item["index"]
+                self.archivo_json[tabla] = registros[:index_lista] + \
+                    (dict_temporal,) + registros[index_lista+1:]
+                self.escribir_archivo()
+                self.notificar(tabla, item, dict_temporal)
             return {"mensaje": "Registro actualizado", "codigo": 200}
         except Exception as e:
             return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
@@ -411,21 +825,468 @@ class GestorJson:
         >>> gestor.borrar("eventos", 1)
         """
         try:
-            respuesta = self.buscar(tabla, id)
+            with self.lock_escritura:
+                respuesta = self.buscar(tabla, id)
+                if respuesta["codigo"] == 500:
+                    raise ValueError(respuesta["mensaje"])
+                item = respuesta["registro"][0]
+                registros = self.archivo_json[tabla]
+                index_lista = registros.index(item)
+                data_eliminada = registros[index_lista]
+                self.archivo_json[tabla] = registros[:index_lista] + \
+                    registros[index_lista+1:]
+                self.escribir_archivo()
+                self.notificar(tabla, data_eliminada, None)
+            return {"data": data_eliminada, "codigo": 200}
+        except Exception as e:
+            return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
+
+
+class GestorArchivo:
+    def __init__(self, nombre_archivo: str = "data_base_archivo.jsonl.gz"):
+        """
+        Almacén frío compartido: cada worker puede tener su propio archivador sobre el mismo archivo, así que
+        las escrituras toman un bloqueo exclusivo entre procesos (flock sobre nombre_archivo + ".lock") y las
+        lecturas uno compartido.
+
+        Args:
+            nombre_archivo (str): Ruta del almacén frío.
+        """
+        self.nombre_archivo = nombre_archivo
+
+    @contextmanager
+    def bloqueo(self, exclusivo: bool = True):
+        """
+        Bloquear el almacén frío frente a otros procesos e hilos mientras dura el bloque with.
+
+        Args:
+            exclusivo (bool): True para escribir, False para leer.
+        """
+        with open(self.nombre_archivo + ".lock", "a") as candado:
+            if fcntl is not None:
+                fcntl.flock(candado, fcntl.LOCK_EX if exclusivo else fcntl.LOCK_SH)
+            yield
+
+    def agregar(self, tabla: str, registros: list[dict]) -> dict:
+        """
+        Agregar registros al almacén frío (JSON por líneas comprimido con gzip).
+        Cada llamada añade un nuevo miembro gzip al final del archivo, sin reescribir lo ya archivado.
+
+        Args:
+            tabla (str): Nombre de la tabla de origen.
+            registros (list[dict]): Registros a archivar.
+
+        Returns:
+            dict: Mensaje de éxito o error.
+            {"mensaje": "Registros archivados", "codigo": 200} o
+            {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
+
+        Example:
+        >>> gestor = GestorArchivo()
+        >>> gestor.agregar("eventos", [{"index": 1, "titulo_evento": "Evento 1"}])
+        """
+        try:
+            if registros:
+                with self.bloqueo(), gzip.open(self.nombre_archivo, "at", encoding="utf-8") as archivo:
+                    for registro in registros:
+                        archivo.write(json.dumps(
+                            {"tabla": tabla, "registro": registro}) + "\n")
+            return {"mensaje": "Registros archivados", "codigo": 200}
+        except Exception as e:
+            return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
+
+    def buscar(self, tabla: str) -> dict:
+        """
+        Obtener todos los registros archivados de una tabla.
+
+        Args:
+            tabla (str): Nombre de la tabla de origen.
+
+        Returns:
+            dict: Registro con mensaje de éxito o mensaje de error.
+            {"registro": [{"campo1": "valor1", ...}, ...], "mensaje": "Registros encontrados", "codigo": 200} o
+            {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
+
+        Example:
+        >>> gestor = GestorArchivo()
+        >>> respuesta = gestor.buscar("eventos")
+        """
+        try:
+            with self.bloqueo(exclusivo=False):
+                lineas = self.leer_lineas()
+            registros = [linea["registro"]
+                         for linea in self.sin_duplicados(lineas) if linea["tabla"] == tabla]
+            return {"registro": registros, "mensaje": "Registros encontrados", "codigo": 200}
+        except Exception as e:
+            return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
+
+    def leer_lineas(self) -> list[dict]:
+        """
+        Leer todas las líneas del almacén frío. Si el archivo no existe se devuelve una lista vacía.
+
+        Returns:
+            list[dict]: Lista de {"tabla": str, "registro": dict}.
+        """
+        if not os.path.exists(self.nombre_archivo):
+            return []
+        with gzip.open(self.nombre_archivo, "rt", encoding="utf-8") as archivo:
+            return [json.loads(linea) for linea in archivo if linea.strip()]
+
+    @staticmethod
+    def sin_duplicados(lineas: list[dict]) -> list[dict]:
+        """
+        Quitar las líneas repetidas de un mismo (tabla, index), conservando la última archivada.
+        Se repiten si un ciclo de archivado escribió en el almacén frío pero falló al extraer de la tabla.
+
+        Args:
+            lineas (list[dict]): Lista de {"tabla": str, "registro": dict}, en el orden del archivo.
+
+        Returns:
+            list[dict]: Lista sin duplicados, en el orden de la última aparición de cada línea.
+        """
+        unicas = {}
+        for posicion, linea in enumerate(lineas):
+            index = linea["registro"].get("index")
+            llave = (linea["tabla"], index) if index is not None else posicion
+            unicas.pop(llave, None)
+            unicas[llave] = linea
+        return list(unicas.values())
+
+    def compactar(self) -> dict:
+        """
+        Reescribir el almacén frío como un único miembro gzip, sin duplicados y ordenado por tabla e index.
+        Se escribe en un archivo temporal y se reemplaza el original, para no perder datos si el proceso falla.
+        Todo se hace con el bloqueo exclusivo tomado: lo que otro proceso agregue espera al reemplazo en vez de
+        perderse con él.
+
+        Returns:
+            dict: Mensaje de éxito o error.
+            {"mensaje": "Archivo compactado", "codigo": 200} o
+            {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
+
+        Example:
+        >>> gestor = GestorArchivo()
+        >>> gestor.compactar()
+        """
+        try:
+            with self.bloqueo():
+                lineas = self.sin_duplicados(self.leer_lineas())
+                if not lineas:
+                    return {"mensaje": "Archivo compactado", "codigo": 200}
+                lineas.sort(key=lambda linea: (
+                    linea["tabla"], linea["registro"].get("index", 0)))
+                descriptor, temporal = tempfile.mkstemp(
+                    dir=os.path.dirname(os.path.abspath(self.nombre_archivo)), suffix=".tmp")
+                try:
+                    with os.fdopen(descriptor, "wb") as destino, \
+                            gzip.open(destino, "wt", encoding="utf-8") as archivo:
+                        for linea in lineas:
+                            archivo.write(json.dumps(linea) + "\n")
+                    os.replace(temporal, self.nombre_archivo)
+                except BaseException:
+                    os.remove(temporal)
+                    raise
+            return {"mensaje": "Archivo compactado", "codigo": 200}
+        except Exception as e:
+            return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
+
+
+class ArchivadorEventos:
+    def __init__(self, gestion_eventos: "GestionEventos", horizonte_dias: int = 0,
+                 intervalo_segundos: int = 3600, ciclos_compactacion: int = 24):
+        """
+        Hilo en segundo plano que archiva periódicamente los eventos pasados.
+
+        Args:
+            gestion_eventos (GestionEventos): Gestor cuyos eventos se archivan.
+            horizonte_dias (int): Días que se conserva un evento pasado antes de archivarlo.
+            intervalo_segundos (int): Segundos entre cada ciclo de archivado.
+            ciclos_compactacion (int): Cada cuántos ciclos se compacta el almacén frío.
+
+        Example:
+        >>> archivador = ArchivadorEventos(GestionEventos(), horizonte_dias=30)
+        >>> archivador.iniciar()
+        """
+        self.gestion_eventos = gestion_eventos
+        self.horizonte_dias = horizonte_dias
+        self.intervalo_segundos = intervalo_segundos
+        self.ciclos_compactacion = ciclos_compactacion
+        self.detenido = threading.Event()
+        self.hilo = None
+
+    def ejecutar_ciclo(self, numero_ciclo: int) -> dict:
+        """
+        Archivar los eventos vencidos y, si corresponde al ciclo, compactar el almacén frío.
+
+        Args:
+            numero_ciclo (int): Número del ciclo actual, empezando en 1.
+
+        Returns:
+            dict: Respuesta de GestionEventos.archivar_eventos.
+        """
+        respuesta = self.gestion_eventos.archivar_eventos(self.horizonte_dias)
+        if self.ciclos_compactacion > 0 and numero_ciclo % self.ciclos_compactacion == 0:
+            self.gestion_eventos.gestor_archivo.compactar()
+        return respuesta
+
+    def iniciar(self) -> None:
+        """
+        Iniciar el hilo de archivado. El primer ciclo se ejecuta de inmediato.
+        """
+        if self.hilo is not None and self.hilo.is_alive():
+            return
+        self.detenido.clear()
+        self.hilo = threading.Thread(target=self._bucle, daemon=True)
+        self.hilo.start()
+
+    def detener(self) -> None:
+        """
+        Detener el hilo de archivado y esperar a que termine el ciclo en curso.
+        """
+        self.detenido.set()
+        if self.hilo is not None:
+            self.hilo.join()
+            self.hilo = None
+
+    def _bucle(self) -> None:
+        numero_ciclo = 1
+        while not self.detenido.is_set():
+            self.ejecutar_ciclo(numero_ciclo)
+            numero_ciclo += 1
+            self.detenido.wait(self.intervalo_segundos)
+
+
+class EstadisticasEventos:
+    def __init__(self, gestor_json: GestorJson, tabla: str = "eventos", espacios_por_dia: int = 8):
+        """
+        Contadores de eventos por ubicación, día y mes, mantenidos con cada cambio en la tabla de eventos.
+        Los contadores se arman recorriendo la tabla una sola vez, en la primera consulta; después solo se
+        actualizan con las notificaciones de GestorJson. Los eventos archivados no se cuentan.
+
+        Args:
+            gestor_json (GestorJson): Gestor de la base de datos a observar.
+            tabla (str): Nombre de la tabla de eventos.
+            espacios_por_dia (int): Espacios disponibles por ubicación y día. Con horas pares entre las
+                8:00 am y las 10:00 pm son 8.
+
+        Example:
+        >>> estadisticas = EstadisticasEventos(GestorJson())
+        >>> respuesta = estadisticas.get_stats()
+        """
+        self.gestor_json = gestor_json
+        self.tabla = tabla
+        self.espacios_por_dia = espacios_por_dia
+        self.lock = threading.Lock()
+        self.cargado = False
+        self.total = 0
+        self.por_ubicacion = {}
+        self.por_dia = {}
+        self.por_mes = {}
+        gestor_json.suscribir(self.actualizar)
+
+    def contar(self, evento: dict, cantidad: int) -> None:
+        """
+        Sumar cantidad (1 o -1) a los contadores del evento, quitando las llaves que quedan en cero.
+        """
+        dia = evento["fecha_hora_evento"][:10]
+        for contador, llave in ((self.por_ubicacion, evento["ubicacion_evento"]), (self.por_dia, dia),
+                                (self.por_mes, dia[:7])):
+            valor = contador.get(llave, 0) + cantidad
+            if valor:
+                contador[llave] = valor
+            else:
+                del contador[llave]
+        self.total += cantidad
+
+    def actualizar(self, tabla: str, anterior: dict, nuevo: dict) -> None:
+        """
+        Función suscrita a GestorJson; se llama con lock_escritura tomado. Ignora otras tablas y los cambios
+        anteriores a la primera carga, que ya quedan incluidos al recorrer la tabla.
+        """
+        if tabla != self.tabla:
+            return
+        with self.lock:
+            if not self.cargado:
+                return
+            if anterior is not None:
+                self.contar(anterior, -1)
+            if nuevo is not None:
+                self.contar(nuevo, 1)
+
+    def cargar(self) -> None:
+        """
+        Recorrer la tabla de eventos para armar los contadores, si todavía no se ha hecho.
+        """
+        # Con lock_escritura tomado ninguna escritura queda entre la instantánea y cargado = True,
+        # así que ningún cambio se cuenta dos veces ni se pierde
+        with self.gestor_json.lock_escritura, self.lock:
+            if self.cargado:
+                return
+            respuesta = self.gestor_json.buscar(self.tabla)
             if respuesta["codigo"] == 500:
                 raise ValueError(respuesta["mensaje"])
-            item = respuesta["registro"][0]
-            index_lista = self.archivo_json[tabla].index(item)
-            data_eliminada = self.archivo_json[tabla].pop(index_lista)
-            self.escribir_archivo()
-            return {"data": data_eliminada, "codigo": 200}
+            for evento in respuesta["registro"]:
+                self.contar(evento, 1)
+            self.cargado = True
+
+    def get_stats(self) -> dict:
+        """
+        Obtener los contadores y la ocupación de los espacios.
+        La ocupación de un día es eventos / (espacios_por_dia * ubicaciones); la de una ubicación es
+        eventos / (espacios_por_dia * días con eventos); la total es eventos / (espacios_por_dia * ubicaciones
+        * días con eventos).
+
+        Returns:
+            dict: Registro con mensaje de éxito o mensaje de error.
+            {"registro": {"total": 10, "por_ubicacion": {0: 4, ...}, "por_dia": {"2025-03-20": 2, ...},
+                "por_mes": {"2025-03": 10, ...}, "ocupacion": {"total": 0.1, "por_ubicacion": {0: 0.5, ...},
+                "por_dia": {"2025-03-20": 0.08, ...}}}, "mensaje": "Estadisticas encontradas", "codigo": 200} o
+            {"mensaje": "Mensaje de error", "codigo": 500, "info": "Informacion adicional del error"}
+        """
+        try:
+            self.cargar()
+            ubicaciones = self.gestor_json.buscar("ubicaciones")
+            if ubicaciones["codigo"] == 500:
+                raise ValueError(ubicaciones["mensaje"])
+            cantidad_ubicaciones = len(ubicaciones["registro"])
+
+            with self.lock:
+                total = self.total
+                por_ubicacion = dict(self.por_ubicacion)
+                por_dia = dict(self.por_dia)
+                por_mes = dict(self.por_mes)
+
+            espacios_dia = self.espacios_por_dia * cantidad_ubicaciones
+            espacios_ubicacion = self.espacios_por_dia * len(por_dia)
+            espacios_total = espacios_dia * len(por_dia)
+            ocupacion = {
+                "total": total / espacios_total if espacios_total else 0,
+                "por_ubicacion": {ubicacion: cantidad / espacios_ubicacion
+                                  for ubicacion, cantidad in por_ubicacion.items()},
+                "por_dia": {dia: cantidad / espacios_dia for dia, cantidad in por_dia.items()} if espacios_dia else {}
+            }
+            return {"registro": {"total": total, "por_ubicacion": por_ubicacion, "por_dia": por_dia,
+                                 "por_mes": por_mes, "ocupacion": ocupacion},
+                    "mensaje": "Estadisticas encontradas", "codigo": 200}
         except Exception as e:
             return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
 
 
+class EspaciosOcupados:
+    def __init__(self, gestor_json: GestorJson, tabla: str = "eventos"):
+        """
+        Index del evento que ocupa cada par (ubicacion_evento, fecha_hora_evento), mantenido con cada cambio en
+        la tabla de eventos. Se arma recorriendo la tabla una sola vez, en la primera consulta; después solo se
+        actualiza con las notificaciones de GestorJson, así que validar un espacio no recorre la tabla.
+
+        Args:
+            gestor_json (GestorJson): Gestor de la base de datos a observar.
+            tabla (str): Nombre de la tabla de eventos.
+
+        Example:
+        >>> espacios = EspaciosOcupados(GestorJson())
+        >>> espacios.cargar()
+        >>> espacios.ocupados.get((1, "2021-10-10 08:00:00"))
+        """
+        self.gestor_json = gestor_json
+        self.tabla = tabla
+        self.cargado = False
+        self.ocupados = {}
+        gestor_json.suscribir(self.actualizar)
+
+    @staticmethod
+    def llave(evento: dict) -> tuple:
+        return (evento["ubicacion_evento"], evento["fecha_hora_evento"])
+
+    def actualizar(self, tabla: str, anterior: dict, nuevo: dict) -> None:
+        """
+        Función suscrita a GestorJson; se llama con lock_escritura tomado. Ignora otras tablas y los cambios
+        anteriores a la primera carga, que ya quedan incluidos al recorrer la tabla.
+        """
+        if tabla != self.tabla or not self.cargado:
+            return
+        if anterior is not None and self.ocupados.get(self.llave(anterior)) == anterior["index"]:
+            del self.ocupados[self.llave(anterior)]
+        if nuevo is not None:
+            self.ocupados[self.llave(nuevo)] = nuevo["index"]
+
+    def cargar(self) -> None:
+        """
+        Recorrer la tabla de eventos para armar el mapa, si todavía no se ha hecho.
+
+        Raises:
+            ValueError: Si no se pueden leer los eventos.
+        """
+        # Todas las modificaciones del mapa ocurren con lock_escritura tomado, así que no hace falta otro lock
+        with self.gestor_json.lock_escritura:
+            if self.cargado:
+                return
+            respuesta = self.gestor_json.buscar(self.tabla)
+            if respuesta["codigo"] == 500:
+                raise ValueError(respuesta["mensaje"])
+            self.ocupados = {self.llave(evento): evento["index"] for evento in respuesta["registro"]}
+            self.cargado = True
+
+
+class CacheEventosJson:
+    def __init__(self, gestor_json: GestorJson, tabla: str = "eventos"):
+        """
+        Caché de cada evento, con su ubicación incluida, ya codificado en JSON (bytes).
+        Cada fragmento se guarda junto con el registro del evento y el de la ubicación con los que se armó.
+        Como GestorJson nunca modifica un registro sino que lo reemplaza, basta comparar por identidad (is)
+        para saber si el evento o su ubicación cambiaron. Además, al actualizar, borrar o archivar un evento se
+        descarta su fragmento para liberar memoria.
+
+        Args:
+            gestor_json (GestorJson): Gestor de la base de datos a observar.
+            tabla (str): Nombre de la tabla de eventos.
+
+        Example:
+        >>> cache = CacheEventosJson(GestorJson())
+        """
+        self.tabla = tabla
+        self.fragmentos = {}
+        gestor_json.suscribir(self.invalidar)
+
+    @staticmethod
+    def codificar(evento: dict) -> bytes:
+        """
+        Codificar un evento en JSON compacto, con las llaves ordenadas como lo hace jsonify.
+        """
+        return json.dumps(evento, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+    def fragmento(self, evento: dict, ubicaciones: tuple) -> bytes:
+        """
+        Obtener el evento codificado con su ubicación, codificándolo solo si no está en caché o cambió.
+
+        Args:
+            evento (dict): Registro del evento, tal como lo devuelve GestorJson.buscar.
+            ubicaciones (tuple): Registros de las ubicaciones.
+
+        Returns:
+            bytes: Evento codificado en JSON.
+        """
+        ubicacion = ubicaciones[evento["ubicacion_evento"]]
+        guardado = self.fragmentos.get(evento["index"])
+        if guardado is not None and guardado[0] is evento and guardado[1] is ubicacion:
+            return guardado[2]
+        evento_copia = dict(evento)
+        evento_copia["ubicacion_evento"] = ubicacion
+        codificado = self.codificar(evento_copia)
+        self.fragmentos[evento["index"]] = (evento, ubicacion, codificado)
+        return codificado
+
+    def invalidar(self, tabla: str, anterior: dict, nuevo: dict) -> None:
+        """
+        Función suscrita a GestorJson. Descarta el fragmento de un evento actualizado, borrado o extraído.
+        """
+        if tabla == self.tabla and anterior is not None:
+            self.fragmentos.pop(anterior["index"], None)
+
+
 class GestorUbicacion:
-    def __init__(self):
-        self.gestor = GestorJson()
+    def __init__(self, gestor: GestorJson = None):
+        self.gestor = gestor if gestor is not None else GestorJson()
         self.tabla = "ubicaciones"
 
     def get_ubicaciones(self):
@@ -444,4 +1305,85 @@ class GestorUbicacion:
             return {"mensaje": str(e), "codigo": 500, "info": traceback.format_exc().splitlines()[-4:-2]}
 
 
-gestor_eventos = GestionEventos()
+class ProveedorGestorEventos:
+    def __init__(self, nombre_archivo: str = "data_base.json",
+                 nombre_archivo_frio: str = "data_base_archivo.jsonl.gz", backend: str = "json",
+                 opciones_archivador: dict = None):
+        """
+        Crea el GestionEventos de forma perezosa, una vez por proceso.
+        Si el proceso se bifurca (servidores pre-fork), el hijo no reutiliza el gestor del padre y crea el suyo
+        en el primer uso o al llamar calentar().
+
+        Args:
+            nombre_archivo (str): Ruta de la base de datos.
+            nombre_archivo_frio (str): Ruta del almacén frío de eventos archivados.
+            backend (str): Nombre del gestor de base de datos, una de las llaves de BACKENDS.
+            opciones_archivador (dict): Argumentos de ArchivadorEventos (horizonte_dias, intervalo_segundos,
+                ciclos_compactacion). Si no es None, cada proceso inicia su archivador al crear su gestor y lo
+                guarda en archivador hasta que se llame detener().
+
+        Example:
+        >>> proveedor = ProveedorGestorEventos("data_base.json")
+        >>> respuesta = proveedor.obtener().get_events()
+        """
+        self.nombre_archivo = nombre_archivo
+        self.nombre_archivo_frio = nombre_archivo_frio
+        self.backend = backend
+        self.opciones_archivador = opciones_archivador
+        self.gestor = None
+        self.archivador = None
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+
+    def obtener(self) -> GestionEventos:
+        """
+        Obtener el gestor del proceso actual, creándolo si todavía no existe. No lee la base de datos.
+
+        Returns:
+            GestionEventos: Gestor de eventos del proceso.
+        """
+        if self.pid != os.getpid():
+            self.gestor = None
+            self.archivador = None
+            self.pid = os.getpid()
+            self.lock = threading.Lock()
+        if self.gestor is None:
+            with self.lock:
+                if self.gestor is None:
+                    gestor = GestionEventos(
+                        self.nombre_archivo, self.nombre_archivo_frio, self.backend)
+                    if self.opciones_archivador is not None:
+                        self.archivador = ArchivadorEventos(gestor, **self.opciones_archivador)
+                        self.archivador.iniciar()
+                    self.gestor = gestor
+        return self.gestor
+
+    def detener(self) -> None:
+        """
+        Detener el archivador que inició este proceso, si hay uno, y esperar a que termine su ciclo.
+        El gestor se conserva.
+
+        Example:
+        >>> proveedor = ProveedorGestorEventos("data_base.json", opciones_archivador={"horizonte_dias": 30})
+        >>> proveedor.obtener()
+        >>> proveedor.detener()
+        """
+        if self.pid == os.getpid() and self.archivador is not None:
+            self.archivador.detener()
+            self.archivador = None
+
+    def calentar(self) -> GestionEventos:
+        """
+        Obtener el gestor y leer la base de datos de inmediato, para que la primera petición no pague la carga.
+        Si la aplicación se crea antes del fork (gunicorn --preload), se llama en cada worker después del fork,
+        por ejemplo con controlador.calentar_worker como hook post_fork de gunicorn.
+
+        Returns:
+            GestionEventos: Gestor de eventos del proceso.
+        """
+        gestor = self.obtener()
+        gestor.gestor_json.archivo_json
+        return gestor
+
+
+BACKENDS = {"json": GestorJson}
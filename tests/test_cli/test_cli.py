@@ -0,0 +1,65 @@
+import io
+import json
+import unittest
+from datetime import datetime
+from cli import exportar, leer_lotes, validar_lote
+from modelo import GestionEventos
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.fecha_actual = datetime(2030, 1, 1, 8, 0, 0)
+
+    def test_exportar_ndjson(self):
+        salida = io.StringIO()
+        cantidad = exportar(GestionEventos(), "ubicaciones", "ndjson", salida)
+        lineas = salida.getvalue().splitlines()
+        self.assertEqual(cantidad, len(lineas))
+        self.assertIn("nombre_ubicacion", json.loads(lineas[0]))
+
+    def test_leer_lotes_csv(self):
+        entrada = io.StringIO(
+            "titulo_evento,fecha_hora_evento,descripcion_evento,ubicacion_evento\n"
+            "Evento,2030-01-02 10:00:00,Descripcion,0\n")
+        lotes = list(leer_lotes(entrada, "csv"))
+        self.assertEqual(len(lotes), 1)
+        self.assertEqual(lotes[0][0], 2)
+
+    def test_validar_lote(self):
+        lineas = [
+            json.dumps({"titulo_evento": "Evento", "fecha_hora_evento": "2030-01-02 10:00:00",
+                        "descripcion_evento": "Descripcion", "ubicacion_evento": 0}),
+            json.dumps({"titulo_evento": "Evento", "fecha_hora_evento": "2030-01-02 11:00:00",
+                        "descripcion_evento": "Descripcion", "ubicacion_evento": 0}),
+            json.dumps({"titulo_evento": "Evento"}),
+            "no es json"
+        ]
+        validos, errores = validar_lote(
+            (1, lineas), "ndjson", 3, self.fecha_actual)
+        self.assertEqual([linea for linea, _ in validos], [1])
+        self.assertEqual([linea for linea, _ in errores], [2, 3, 4])
+
+    def test_validar_lote_no_convierte_tipos(self):
+        evento = {"titulo_evento": "Evento", "fecha_hora_evento": "2030-01-02 10:00:00",
+                  "descripcion_evento": "Descripcion", "ubicacion_evento": 1}
+        lineas = [json.dumps({**evento, "titulo_evento": None}),
+                  json.dumps({**evento, "descripcion_evento": 123}),
+                  json.dumps({**evento, "ubicacion_evento": 1.9}),
+                  json.dumps({**evento, "ubicacion_evento": True})]
+        validos, errores = validar_lote(
+            (1, lineas), "ndjson", 3, self.fecha_actual)
+        self.assertEqual(validos, [])
+        self.assertEqual([linea for linea, _ in errores], [1, 2, 3, 4])
+
+    def test_validar_lote_csv_convierte_ubicacion_entera(self):
+        fila = {"titulo_evento": "Evento", "fecha_hora_evento": "2030-01-02 10:00:00",
+                "descripcion_evento": "Descripcion", "ubicacion_evento": "1"}
+        validos, errores = validar_lote(
+            (2, [fila, {**fila, "ubicacion_evento": "1.9"}]), "csv", 3, self.fecha_actual)
+        self.assertEqual(validos[0][1]["ubicacion_evento"], 1)
+        self.assertEqual([linea for linea, _ in errores], [3])
+
+
+if __name__ == '__main__':
+    unittest.main()
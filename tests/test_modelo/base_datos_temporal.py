@@ -0,0 +1,40 @@
+import json
+import os
+import tempfile
+import unittest
+from modelo import GestionEventos
+
+UBICACIONES = [{"nombre_ubicacion": "Ubicacion", "direccion_ubicacion": "Direccion"}]
+
+
+def evento(index: int, fecha_hora_evento: str, ubicacion_evento: int = 0, titulo_evento: str = None) -> dict:
+    """
+    Armar un registro de evento para las bases de datos de prueba.
+    """
+    return {"index": index, "titulo_evento": titulo_evento or f"Evento {index}",
+            "fecha_hora_evento": fecha_hora_evento, "descripcion_evento": "Descripcion",
+            "ubicacion_evento": ubicacion_evento}
+
+
+class CasoBaseDatosTemporal(unittest.TestCase):
+    """
+    Caso de prueba que trabaja sobre una base de datos en un directorio temporal, que se borra al terminar,
+    en vez de modificar data_base.json.
+    """
+
+    def crear_base_datos(self, eventos: list[dict], ubicaciones: list[dict] = None) -> tuple[str, str]:
+        """
+        Escribir la base de datos y devolver las rutas (base de datos, almacén frío).
+        """
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        ruta_json = os.path.join(directorio.name, "data_base.json")
+        with open(ruta_json, "w", encoding="utf-8") as archivo:
+            json.dump({"eventos": eventos, "ubicaciones": ubicaciones or UBICACIONES}, archivo)
+        return ruta_json, os.path.join(directorio.name, "data_base_archivo.jsonl.gz")
+
+    def crear_gestion(self, eventos: list[dict], ubicaciones: list[dict] = None) -> GestionEventos:
+        """
+        Crear un GestionEventos sobre una base de datos temporal.
+        """
+        return GestionEventos(*self.crear_base_datos(eventos, ubicaciones))
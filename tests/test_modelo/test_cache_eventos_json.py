@@ -0,0 +1,36 @@
+import json
+import unittest
+from tests.test_modelo.base_datos_temporal import CasoBaseDatosTemporal, evento
+
+
+class TestCacheEventosJson(CasoBaseDatosTemporal):
+
+    def setUp(self):
+        self.gestion_eventos = self.crear_gestion([evento(1, "2030-01-02 08:00:00")])
+
+    def test_fragmento_coincide_con_get_events(self):
+        respuesta = self.gestion_eventos.get_events_serializados()
+        self.assertEqual(respuesta["codigo"], 200)
+        self.assertEqual([json.loads(fragmento) for fragmento in respuesta["registro"]],
+                         self.gestion_eventos.get_events()["registro"])
+
+    def test_fragmento_se_reutiliza_hasta_que_cambia(self):
+        primero = self.gestion_eventos.get_event_by_id_serializado(1)["registro"][0]
+        segundo = self.gestion_eventos.get_event_by_id_serializado(1)["registro"][0]
+        self.assertIs(primero, segundo)
+
+        self.gestion_eventos.gestor_json.actualizar("eventos",
+                                                    ["titulo_evento", "fecha_hora_evento",
+                                                     "descripcion_evento", "ubicacion_evento"],
+                                                    ["Evento actualizado", "2030-01-02 08:00:00", "Descripcion", 0], 1)
+        tercero = self.gestion_eventos.get_event_by_id_serializado(1)["registro"][0]
+        self.assertEqual(json.loads(tercero)["titulo_evento"], "Evento actualizado")
+
+    def test_borrar_descarta_fragmento(self):
+        self.gestion_eventos.get_events_serializados()
+        self.gestion_eventos.delete_event_by_id(1)
+        self.assertEqual(self.gestion_eventos.cache_json.fragmentos, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+from tests.test_modelo.base_datos_temporal import CasoBaseDatosTemporal, evento
+
+
+class TestEspaciosOcupados(CasoBaseDatosTemporal):
+
+    def setUp(self):
+        self.manana = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+        self.manana_str = self.manana.strftime("%Y-%m-%d %H:%M:%S")
+        self.gestion_eventos = self.crear_gestion([evento(1, self.manana_str)])
+        self.campos = ["titulo_evento", "fecha_hora_evento",
+                       "descripcion_evento", "ubicacion_evento"]
+
+    def test_cambios_incrementales(self):
+        espacios = self.gestion_eventos.espacios
+        gestor_json = self.gestion_eventos.gestor_json
+        self.assertEqual(self.gestion_eventos.espacios_ocupados(), {(0, self.manana_str): 1})
+
+        gestor_json.crear("eventos", self.campos, ["Evento 2", "2030-02-03 10:00:00", "Descripcion", 1])
+        gestor_json.actualizar("eventos", self.campos, ["Evento 1", "2030-02-03 12:00:00", "Descripcion", 0], 1)
+        self.assertEqual(espacios.ocupados, {(1, "2030-02-03 10:00:00"): 2, (0, "2030-02-03 12:00:00"): 1})
+
+        gestor_json.borrar("eventos", 2)
+        self.assertEqual(espacios.ocupados, {(0, "2030-02-03 12:00:00"): 1})
+
+    def test_espacio_ocupado(self):
+        respuesta = self.gestion_eventos.post_events("Evento 2", self.manana, "Descripcion", 0)
+        self.assertEqual(respuesta["codigo_error"], "ESPACIO_OCUPADO")
+
+        respuesta = self.gestion_eventos.put_event_by_id("Evento 1", self.manana, "Descripcion", 0, 1)
+        self.assertEqual(respuesta["codigo"], 200)
+
+    def test_lote_no_modifica_el_mapa_compartido(self):
+        otra_hora = self.manana.replace(hour=12).strftime("%Y-%m-%d %H:%M:%S")
+        lote = [{"titulo_evento": "Evento", "fecha_hora_evento": fecha, "descripcion_evento": "Descripcion",
+                 "ubicacion_evento": 0} for fecha in (self.manana_str, otra_hora, otra_hora)]
+        respuesta = self.gestion_eventos.post_events_lote(lote)
+        self.assertEqual(respuesta["creados"], 1)
+        self.assertEqual([rechazo["posicion"] for rechazo in respuesta["rechazados"]], [0, 2])
+        self.assertEqual(self.gestion_eventos.espacios_ocupados(), {(0, self.manana_str): 1, (0, otra_hora): 2})
+
+    def test_escrituras_concurrentes_no_reservan_el_mismo_espacio(self):
+        fecha = self.manana.replace(hour=12)
+        barrera = threading.Barrier(8)
+        respuestas = []
+
+        def crear():
+            barrera.wait()
+            respuestas.append(self.gestion_eventos.post_events("Evento", fecha, "Descripcion", 0))
+
+        hilos = [threading.Thread(target=crear) for _ in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(sum(respuesta["codigo"] == 200 for respuesta in respuestas), 1)
+        eventos = self.gestion_eventos.gestor_json.buscar("eventos")["registro"]
+        self.assertEqual(len(eventos), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from tests.test_modelo.base_datos_temporal import CasoBaseDatosTemporal, evento
+
+
+class TestEstadisticasEventos(CasoBaseDatosTemporal):
+
+    def setUp(self):
+        self.gestion_eventos = self.crear_gestion(
+            [evento(1, "2030-01-02 08:00:00")],
+            [{"nombre_ubicacion": "Ubicacion 1", "direccion_ubicacion": "Direccion"},
+             {"nombre_ubicacion": "Ubicacion 2", "direccion_ubicacion": "Direccion"}])
+        self.campos = ["titulo_evento", "fecha_hora_evento",
+                       "descripcion_evento", "ubicacion_evento"]
+
+    def test_carga_inicial(self):
+        respuesta = self.gestion_eventos.estadisticas.get_stats()
+        self.assertEqual(respuesta["codigo"], 200)
+        self.assertEqual(respuesta["registro"]["total"], 1)
+        self.assertEqual(respuesta["registro"]["por_dia"], {"2030-01-02": 1})
+        self.assertEqual(respuesta["registro"]["ocupacion"]["por_dia"], {"2030-01-02": 1 / 16})
+        self.assertEqual(respuesta["registro"]["ocupacion"]["por_ubicacion"], {0: 1 / 8})
+
+    def test_cambios_incrementales(self):
+        estadisticas = self.gestion_eventos.estadisticas
+        gestor_json = self.gestion_eventos.gestor_json
+        estadisticas.get_stats()
+
+        gestor_json.crear("eventos", self.campos, [
+                          "Evento 2", "2030-02-03 10:00:00", "Descripcion", 1])
+        gestor_json.actualizar("eventos", self.campos, [
+                               "Evento 1", "2030-02-03 10:00:00", "Descripcion", 0], 1)
+        registro = estadisticas.get_stats()["registro"]
+        self.assertEqual(registro["total"], 2)
+        self.assertEqual(registro["por_mes"], {"2030-02": 2})
+        self.assertEqual(registro["por_ubicacion"], {0: 1, 1: 1})
+
+        gestor_json.borrar("eventos", 2)
+        registro = estadisticas.get_stats()["registro"]
+        self.assertEqual(registro["total"], 1)
+        self.assertEqual(registro["por_ubicacion"], {0: 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import threading
+import unittest
+from datetime import datetime
+from modelo import GestorArchivo
+from tests.test_modelo.base_datos_temporal import CasoBaseDatosTemporal, evento
+
+
+class TestGestorArchivo(CasoBaseDatosTemporal):
+
+    def setUp(self):
+        self.gestion_eventos = self.crear_gestion([
+            evento(1, "2000-01-01 08:00:00", titulo_evento="Pasado"),
+            evento(2, "2999-01-01 08:00:00", titulo_evento="Futuro")
+        ])
+
+    def test_buscar_sin_archivo(self):
+        respuesta = self.gestion_eventos.gestor_archivo.buscar("eventos")
+        self.assertEqual(respuesta["codigo"], 200)
+        self.assertEqual(respuesta["registro"], [])
+
+    def test_archivar_eventos(self):
+        respuesta = self.gestion_eventos.archivar_eventos()
+        self.assertEqual(respuesta["codigo"], 200)
+        self.assertEqual(respuesta["cantidad"], 1)
+
+        vigentes = self.gestion_eventos.gestor_json.buscar("eventos")
+        self.assertEqual([evento["index"]
+                         for evento in vigentes["registro"]], [2])
+        archivados = self.gestion_eventos.gestor_archivo.buscar("eventos")
+        self.assertEqual([evento["index"]
+                         for evento in archivados["registro"]], [1])
+
+    def test_archivar_no_pierde_actualizacion_concurrente(self):
+        gestor_json = self.gestion_eventos.gestor_json
+        gestor_archivo = self.gestion_eventos.gestor_archivo
+        agregar = gestor_archivo.agregar
+        respuestas = []
+
+        def actualizar():
+            respuestas.append(gestor_json.actualizar(
+                "eventos", ["titulo_evento", "fecha_hora_evento", "descripcion_evento", "ubicacion_evento"],
+                ["Movido", "2999-02-01 08:00:00", "Descripcion", 0], 1))
+
+        def agregar_y_actualizar(tabla, registros):
+            # La actualización llega en medio del archivado; se le da tiempo para terminar si nada la bloquea
+            hilo = threading.Thread(target=actualizar)
+            hilo.start()
+            hilo.join(0.2)
+            self.hilo = hilo
+            return agregar(tabla, registros)
+
+        gestor_archivo.agregar = agregar_y_actualizar
+        self.gestion_eventos.archivar_eventos()
+        self.hilo.join()
+
+        # La actualización espera al archivado y falla porque el evento ya no está, en vez de perderse
+        self.assertEqual(respuestas[0]["codigo"], 500)
+        vigentes = gestor_json.buscar("eventos")["registro"]
+        self.assertEqual([evento["index"] for evento in vigentes], [2])
+        self.assertEqual(gestor_archivo.buscar("eventos")["registro"][0]["titulo_evento"], "Pasado")
+
+    def test_index_no_se_reutiliza(self):
+        self.gestion_eventos.gestor_json.extraer(
+            "eventos", lambda evento: True)
+        self.assertEqual(
+            self.gestion_eventos.gestor_json.siguiente_index("eventos"), 3)
+
+    def test_buscar_por_id_sin_eventos_vigentes(self):
+        self.gestion_eventos.gestor_json.extraer(
+            "eventos", lambda evento: True)
+        self.assertEqual(
+            self.gestion_eventos.gestor_json.buscar("eventos", 1)["codigo"], 404)
+        respuesta = self.gestion_eventos.put_event_by_id(
+            "Evento", datetime(2999, 1, 2, 10), "Descripcion", 0, 1)
+        self.assertEqual(respuesta["codigo_error"], "EVENTO_NO_EXISTE")
+
+    def test_compactar(self):
+        gestor_archivo = self.gestion_eventos.gestor_archivo
+        gestor_archivo.agregar("eventos", [{"index": 2}])
+        gestor_archivo.agregar("eventos", [{"index": 1}])
+        respuesta = gestor_archivo.compactar()
+        self.assertEqual(respuesta["codigo"], 200)
+        self.assertEqual([evento["index"] for evento in gestor_archivo.buscar("eventos")["registro"]],
+                         [1, 2])
+
+    def test_compactar_quita_duplicados(self):
+        gestor_archivo = self.gestion_eventos.gestor_archivo
+        gestor_archivo.agregar("eventos", [{"index": 1, "titulo_evento": "Viejo"}])
+        gestor_archivo.agregar("eventos", [{"index": 1, "titulo_evento": "Nuevo"}])
+        gestor_archivo.compactar()
+        self.assertEqual(len(gestor_archivo.leer_lineas()), 1)
+        self.assertEqual(gestor_archivo.buscar("eventos")["registro"][0]["titulo_evento"], "Nuevo")
+
+    def test_compactar_no_pierde_agregados_de_otro_proceso(self):
+        gestor_archivo = self.gestion_eventos.gestor_archivo
+        otro_gestor = GestorArchivo(gestor_archivo.nombre_archivo)
+        gestor_archivo.agregar("eventos", [{"index": 1}])
+        leer_lineas = gestor_archivo.leer_lineas
+
+        def leer_y_agregar():
+            # Otro worker agrega entre la lectura y el reemplazo; se le da tiempo si nada lo bloquea
+            lineas = leer_lineas()
+            self.hilo = threading.Thread(target=otro_gestor.agregar, args=("eventos", [{"index": 2}]))
+            self.hilo.start()
+            self.hilo.join(0.2)
+            return lineas
+
+        gestor_archivo.leer_lineas = leer_y_agregar
+        self.assertEqual(gestor_archivo.compactar()["codigo"], 200)
+        self.hilo.join()
+
+        self.assertEqual([evento["index"] for evento in otro_gestor.buscar("eventos")["registro"]], [1, 2])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
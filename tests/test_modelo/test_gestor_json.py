@@ -1,5 +1,8 @@
+import json
+import os
+import tempfile
 import unittest
-from modelo import GestorJson
+from modelo import GestorJson, ProveedorGestorEventos
 class TestGestorJson(unittest.TestCase):
 
     def setUp(self):
@@ -9,3 +12,27 @@ class TestGestorJson(unittest.TestCase):
         data = self.gestor_json.leer_archivo()
         self.assertIsNotNone(data)
         self.assertIsInstance(data, dict)
+
+    def test_carga_perezosa(self):
+        gestor_json = GestorJson("no_existe.json")
+        with self.assertRaises(FileNotFoundError):
+            gestor_json.archivo_json
+
+    def test_proveedor_reutiliza_gestor(self):
+        proveedor = ProveedorGestorEventos()
+        self.assertIs(proveedor.obtener(), proveedor.obtener())
+        self.assertIsNotNone(proveedor.calentar().gestor_json.archivo_json)
+
+    def test_buscar_devuelve_instantanea(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "data_base.json")
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                json.dump({"eventos": [{"index": 1, "titulo_evento": "Evento 1"}]}, archivo)
+            gestor_json = GestorJson(ruta)
+            instantanea = gestor_json.buscar("eventos")["registro"]
+
+            gestor_json.crear("eventos", ["titulo_evento"], ["Evento 2"])
+            gestor_json.actualizar("eventos", ["titulo_evento"], ["Evento 1 actualizado"], 1)
+
+            self.assertEqual(instantanea, ({"index": 1, "titulo_evento": "Evento 1"},))
+            self.assertEqual(len(gestor_json.buscar("eventos")["registro"]), 2)
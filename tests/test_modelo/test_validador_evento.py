@@ -0,0 +1,43 @@
+import unittest
+from datetime import datetime
+from modelo import ValidadorEvento
+
+
+class TestValidadorEvento(unittest.TestCase):
+
+    def setUp(self):
+        self.validador = ValidadorEvento()
+        self.fecha_actual = datetime(2030, 1, 1, 8, 0, 0)
+
+    def validar(self, titulo="Evento", fecha="2030-01-02 10:00:00", descripcion="Descripcion", ubicacion=0):
+        if isinstance(fecha, str):
+            fecha = datetime.strptime(fecha, "%Y-%m-%d %H:%M:%S")
+        return self.validador.validar(titulo, fecha, descripcion, ubicacion, 3, self.fecha_actual)
+
+    def test_evento_valido(self):
+        self.assertIsNone(self.validar())
+
+    def test_codigos_de_error(self):
+        casos = [
+            ("CAMPOS_VACIOS", {"titulo": "  "}),
+            ("FECHA_INVALIDA", {"fecha": None}),
+            ("FECHA_PASADA", {"fecha": "2029-12-31 10:00:00"}),
+            ("FECHA_LEJANA", {"fecha": "2033-01-02 10:00:00"}),
+            ("HORA_FUERA_DE_RANGO", {"fecha": "2030-01-02 06:00:00"}),
+            ("HORA_NO_PERMITIDA", {"fecha": "2030-01-02 11:00:00"}),
+            ("UBICACION_NO_EXISTE", {"ubicacion": 3}),
+        ]
+        for codigo_error, campos in casos:
+            with self.subTest(codigo_error=codigo_error):
+                self.assertEqual(self.validar(**campos)["codigo_error"], codigo_error)
+
+    def test_validar_espacio(self):
+        ocupados = {(0, "2030-01-02 10:00:00"): 7}
+        error = self.validador.validar_espacio(0, "2030-01-02 10:00:00", ocupados)
+        self.assertEqual(error["codigo_error"], "ESPACIO_OCUPADO")
+        self.assertIsNone(self.validador.validar_espacio(
+            0, "2030-01-02 10:00:00", ocupados, 7))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -91,5 +91,10 @@ class TestApi(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn('data', response.json)
 
+    def test_93_get_stats(self):
+        response = self.app.get('/stats')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('total', response.json['data'])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,58 @@
+import time
+import unittest
+from types import SimpleNamespace
+from controlador import calentar_worker, crear_app
+from tests.test_modelo.base_datos_temporal import CasoBaseDatosTemporal, evento
+
+
+class TestCrearApp(CasoBaseDatosTemporal):
+
+    def setUp(self):
+        self.ruta_json, self.ruta_archivo = self.crear_base_datos(
+            [evento(1, "2000-01-01 08:00:00", titulo_evento="Pasado")])
+
+    def test_archivar_desde_configuracion(self):
+        app = crear_app({"ARCHIVO_BASE_DATOS": self.ruta_json,
+                         "ARCHIVO_HISTORICO": self.ruta_archivo,
+                         "ARCHIVAR": True, "ARCHIVO_HORIZONTE_DIAS": 0})
+        proveedor = app.extensions["gestor_eventos"]
+        self.addCleanup(proveedor.detener)
+        cliente = app.test_client()
+        cliente.get('/events')
+
+        gestor_json = proveedor.obtener().gestor_json
+        limite = time.monotonic() + 5
+        while gestor_json.buscar("eventos")["registro"] and time.monotonic() < limite:
+            time.sleep(0.01)
+
+        self.assertEqual(cliente.get('/events').json["data"], [])
+        self.assertEqual(len(cliente.get('/events?include_archived=true').json["data"]), 1)
+
+        hilo = proveedor.archivador.hilo
+        proveedor.detener()
+        self.assertFalse(hilo.is_alive())
+        self.assertIsNone(proveedor.archivador)
+
+    def test_sin_precargar_no_lee_la_base_de_datos(self):
+        app = crear_app({"ARCHIVO_BASE_DATOS": self.ruta_json, "ARCHIVO_HISTORICO": self.ruta_archivo})
+        self.assertIsNone(app.extensions["gestor_eventos"].gestor)
+
+    def test_precargar_lee_la_base_de_datos_al_crear_la_app(self):
+        app = crear_app({"ARCHIVO_BASE_DATOS": self.ruta_json, "ARCHIVO_HISTORICO": self.ruta_archivo,
+                         "PRECARGAR": True})
+        proveedor = app.extensions["gestor_eventos"]
+        self.assertIsNotNone(proveedor.gestor)
+        self.assertIsNotNone(proveedor.gestor.gestor_json._archivo_json)
+
+    def test_calentar_worker_lee_la_base_de_datos(self):
+        app = crear_app({"ARCHIVO_BASE_DATOS": self.ruta_json, "ARCHIVO_HISTORICO": self.ruta_archivo})
+        worker = SimpleNamespace(app=SimpleNamespace(wsgi=lambda: app))
+        calentar_worker(None, worker)
+
+        proveedor = app.extensions["gestor_eventos"]
+        self.assertIsNotNone(proveedor.gestor)
+        self.assertIsNotNone(proveedor.gestor.gestor_json._archivo_json)
+
+
+if __name__ == '__main__':
+    unittest.main()